@@ -3,20 +3,30 @@ API Routes
 REST API endpoints for blockchain operations
 """
 
-from fastapi import APIRouter, HTTPException, status
-from typing import List
+import asyncio
+import json
+from fastapi import APIRouter, HTTPException, Query, Request, Response, WebSocket, status
+from fastapi.responses import StreamingResponse
+from typing import Any, Dict, List, Optional, Set
 from .schemas import (
     TransactionCreate,
     TransactionResponse,
     BlockResponse,
     ChainResponse,
+    BlocksResponse,
     MineRequest,
     StatsResponse,
     BalanceRequest,
     BalanceResponse,
+    BalancesRequest,
+    BalancesResponse,
     MessageResponse
 )
-from ..services.blockchain_service import blockchain_service
+from ..config.settings import settings
+from ..services.container import services, ServiceNotReady
+from ..services.export import iter_ndjson, gzip_chunks
+from ..services.events import EVENT_TYPES, Subscription
+from ..services.block_cache import dumps
 
 # Create router
 router = APIRouter(prefix="/api", tags=["blockchain"])
@@ -31,14 +41,23 @@ async def root():
         "data": {
             "version": "1.0.0",
             "endpoints": [
-                "GET /api/chain - Get entire blockchain",
-                "GET /api/chain/validate - Validate blockchain",
+                "GET /api/chain - Get the blockchain (capped at BLOCKS_MAX_PAGE_SIZE blocks, see next_cursor)",
+                "GET /api/blocks - Get a page of blocks (?from=&to=&limit=&headers_only=true)",
+                "GET /api/chain/validate - Validate blockchain (?full=true for a complete re-check)",
                 "GET /api/block/{index} - Get specific block",
                 "POST /api/transaction - Create new transaction",
+                "POST /api/transactions/batch - Create many transactions (JSON array or NDJSON)",
                 "GET /api/transactions/pending - Get pending transactions",
-                "POST /api/mine - Mine pending transactions",
+                "POST /api/mine - Start a background mining job",
+                "GET /api/mine/{job_id} - Get mining job status and result",
+                "DELETE /api/mine/{job_id} - Cancel a mining job",
+                "GET /api/export/blocks - Stream blocks as NDJSON (?from=&gzip=true)",
+                "GET /api/export/transactions - Stream transactions as NDJSON (?from=&gzip=true)",
+                "GET /api/events - Server-Sent Events stream of new blocks and transactions (?types=&address=)",
+                "WS /api/ws/events - WebSocket stream of new blocks and transactions (?types=&address=)",
                 "GET /api/stats - Get blockchain statistics",
                 "POST /api/balance - Get address balance",
+                "POST /api/balances - Get balances of many addresses",
                 "POST /api/reset - Reset blockchain (caution!)"
             ]
         }
@@ -47,23 +66,53 @@ async def root():
 
 @router.get("/chain", response_model=ChainResponse)
 async def get_chain():
-    """Get the entire blockchain"""
-    chain = blockchain_service.get_chain()
-    return {
-        "chain": chain,
-        "length": len(chain)
-    }
+    """
+    Get the blockchain from the genesis block
+    At most BLOCKS_MAX_PAGE_SIZE blocks are returned; use /blocks with next_cursor for the rest
+    """
+    content = services.blockchain_service.get_blocks_json(
+        limit=settings.BLOCKS_MAX_PAGE_SIZE,
+        list_key="chain"
+    )
+    return Response(content=content, media_type="application/json")
+
+
+@router.get("/blocks", response_model=BlocksResponse)
+async def get_blocks(
+    start: int = Query(0, alias="from", ge=0, description="First block index (or the next_cursor of the previous page)"),
+    end: Optional[int] = Query(None, alias="to", ge=0, description="Last block index, inclusive"),
+    limit: int = Query(settings.BLOCKS_PAGE_SIZE, ge=1, le=settings.BLOCKS_MAX_PAGE_SIZE),
+    headers_only: bool = Query(False, description="Return headers with a transaction count instead of full blocks")
+):
+    """Get a page of blocks in index order"""
+    if headers_only:
+        return services.blockchain_service.get_blocks(
+            start=start,
+            end=end,
+            limit=limit,
+            headers_only=True
+        )
+    
+    # Full blocks come pre-serialized from the block cache
+    content = services.blockchain_service.get_blocks_json(start=start, end=end, limit=limit)
+    return Response(content=content, media_type="application/json")
 
 
 @router.get("/chain/validate", response_model=MessageResponse)
-async def validate_chain():
-    """Validate the blockchain"""
-    result = blockchain_service.validate_chain()
+async def validate_chain(full: bool = False):
+    """
+    Validate the blockchain
+    Only blocks appended since the last validation are checked unless full=true
+    """
+    # A full validation waits on the process pool, keep it off the event loop
+    result = await asyncio.to_thread(services.blockchain_service.validate_chain, full=full)
     return {
         "success": result['valid'],
         "message": result['message'],
         "data": {
-            "total_blocks": result['total_blocks']
+            "total_blocks": result['total_blocks'],
+            "validated_height": result['validated_height'],
+            "report": result['report']
         }
     }
 
@@ -71,7 +120,7 @@ async def validate_chain():
 @router.get("/block/{index}", response_model=dict)
 async def get_block(index: int):
     """Get a specific block by index"""
-    block = blockchain_service.get_block(index)
+    block = services.blockchain_service.get_block_json(index)
     
     if block is None:
         raise HTTPException(
@@ -79,16 +128,17 @@ async def get_block(index: int):
             detail=f"Block with index {index} not found"
         )
     
-    return block
+    return Response(content=block, media_type="application/json")
 
 
 @router.post("/transaction", response_model=MessageResponse)
 async def create_transaction(transaction: TransactionCreate):
     """Create a new transaction"""
-    result = blockchain_service.add_transaction(
+    result = services.blockchain_service.add_transaction(
         sender=transaction.sender,
         recipient=transaction.recipient,
-        amount=transaction.amount
+        amount=transaction.amount,
+        fee=transaction.fee
     )
     
     if not result['success']:
@@ -107,53 +157,327 @@ async def create_transaction(transaction: TransactionCreate):
     }
 
 
+@router.post(
+    "/transactions/batch",
+    response_model=MessageResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {"type": "array", "items": TransactionCreate.model_json_schema()}
+                },
+                "application/x-ndjson": {
+                    "schema": {"type": "string", "description": "One transaction object per line"}
+                }
+            }
+        }
+    }
+)
+async def create_transactions_batch(request: Request):
+    """
+    Create many transactions in one request
+    Accepts a JSON array or NDJSON (Content-Type: application/x-ndjson)
+    and returns an accept/reject result per item
+    """
+    body = await request.body()
+    
+    try:
+        if 'ndjson' in request.headers.get('content-type', ''):
+            items = [json.loads(line) for line in body.splitlines() if line.strip()]
+        else:
+            items = json.loads(body)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid request body: {e}"
+        )
+    
+    if not isinstance(items, list):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Request body must be a JSON array of transactions"
+        )
+    
+    if len(items) > settings.MAX_TRANSACTION_BATCH:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Batch exceeds {settings.MAX_TRANSACTION_BATCH} transactions"
+        )
+    
+    result = services.blockchain_service.add_transactions(items)
+    
+    return {
+        "success": True,
+        "message": f"{result['accepted']} transaction(s) accepted, {result['rejected']} rejected",
+        "data": result
+    }
+
+
 @router.get("/transactions/pending", response_model=List[dict])
 async def get_pending_transactions():
     """Get all pending transactions"""
-    return blockchain_service.get_pending_transactions()
+    return services.blockchain_service.get_pending_transactions()
 
 
-@router.post("/mine", response_model=MessageResponse)
+@router.post("/mine", response_model=MessageResponse, status_code=status.HTTP_202_ACCEPTED)
 async def mine_block(request: MineRequest):
-    """Mine pending transactions into a new block"""
-    result = blockchain_service.mine_block(request.miner_address)
+    """
+    Start mining pending transactions into a new block
+    Returns a job id right away, poll GET /api/mine/{job_id} for the result
+    """
+    if not len(services.blockchain_service.blockchain.pending_transactions):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='No pending transactions to mine'
+        )
+    
+    result = services.mining_job_manager.submit(request.miner_address)
     
     if not result['success']:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             detail=result['message']
         )
     
     return {
         "success": True,
         "message": result['message'],
-        "data": {
-            "block": result['block'],
-            "reward": result['reward']
-        }
+        "data": result['job']
+    }
+
+
+@router.get("/mine/{job_id}", response_model=MessageResponse)
+async def get_mining_job(job_id: str):
+    """Get the status and result of a mining job"""
+    job = services.mining_job_manager.get(job_id)
+    
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Mining job {job_id} not found"
+        )
+    
+    return {
+        "success": True,
+        "message": f"Mining job is {job['status']}",
+        "data": job
     }
 
 
+@router.delete("/mine/{job_id}", response_model=MessageResponse)
+async def cancel_mining_job(job_id: str):
+    """Cancel a queued or running mining job"""
+    job = services.mining_job_manager.cancel(job_id)
+    
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Mining job {job_id} not found"
+        )
+    
+    return {
+        "success": True,
+        "message": f"Mining job is {job['status']}",
+        "data": job
+    }
+
+
+def _ndjson_response(export: Dict[str, Any], compress: bool) -> StreamingResponse:
+    """
+    Stream export records as NDJSON
+    
+    Args:
+        export: Export from the blockchain service (height and records)
+        compress: Gzip the stream
+        
+    Returns:
+        Streaming response with the exported height in X-Chain-Height
+    """
+    chunks = iter_ndjson(export['records'])
+    headers = {"X-Chain-Height": str(export['height'])}
+    if compress:
+        chunks = gzip_chunks(chunks)
+        headers["Content-Encoding"] = "gzip"
+    
+    return StreamingResponse(chunks, media_type="application/x-ndjson", headers=headers)
+
+
+@router.get("/export/blocks")
+async def export_blocks(
+    start: int = Query(0, alias="from", ge=0, description="First block index (resume point)"),
+    gzip: bool = Query(False, description="Gzip-compress the stream")
+):
+    """
+    Export blocks as NDJSON, one block per line
+    Resume a later export from X-Chain-Height + 1
+    """
+    return _ndjson_response(services.blockchain_service.export_blocks(start), gzip)
+
+
+@router.get("/export/transactions")
+async def export_transactions(
+    start: int = Query(0, alias="from", ge=0, description="First block index (resume point)"),
+    gzip: bool = Query(False, description="Gzip-compress the stream")
+):
+    """
+    Export transactions as NDJSON, one transaction per line with its block_index
+    Resume a later export from X-Chain-Height + 1
+    """
+    return _ndjson_response(services.blockchain_service.export_transactions(start), gzip)
+
+
+def _parse_event_types(types: Optional[str]) -> Optional[Set[str]]:
+    """
+    Parse a comma-separated event type filter
+    
+    Args:
+        types: Query value, e.g. "block,transaction" (None = all types)
+        
+    Returns:
+        Set of event types, or None for all types
+    """
+    if not types:
+        return None
+    
+    selected = {t.strip() for t in types.split(',') if t.strip()}
+    unknown = selected - set(EVENT_TYPES)
+    if unknown:
+        raise ValueError(f"Unknown event type(s) {sorted(unknown)}, use {list(EVENT_TYPES)}")
+    return selected
+
+
+def _subscribe(types: Optional[str], address: Optional[str]) -> Subscription:
+    """Subscribe to the event bus, raising HTTPException for a bad filter or too many subscribers"""
+    try:
+        event_types = _parse_event_types(types)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    subscription = services.blockchain_service.events.subscribe(event_types, address)
+    if subscription is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Subscriber limit of {settings.EVENT_MAX_SUBSCRIBERS} reached"
+        )
+    return subscription
+
+
+@router.get("/events")
+async def stream_events(
+    types: Optional[str] = Query(None, description="Comma-separated event types: block, transaction, reset"),
+    address: Optional[str] = Query(None, description="Only events involving this address")
+):
+    """
+    Stream new blocks and mempool changes as Server-Sent Events
+    A "lagged" event reports events dropped while the client was too slow
+    """
+    subscription = _subscribe(types, address)
+    events = services.blockchain_service.events
+    
+    async def stream():
+        try:
+            while True:
+                try:
+                    event = await asyncio.wait_for(subscription.get(), settings.EVENT_KEEPALIVE)
+                except asyncio.TimeoutError:
+                    # Comment line, keeps idle connections open through proxies
+                    yield b": keep-alive\n\n"
+                    continue
+                
+                if event is None:
+                    break
+                yield f"id: {event['id']}\nevent: {event['type']}\ndata: ".encode() + dumps(event) + b"\n\n"
+        finally:
+            events.unsubscribe(subscription)
+    
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.websocket("/ws/events")
+async def events_websocket(
+    websocket: WebSocket,
+    types: Optional[str] = None,
+    address: Optional[str] = None
+):
+    """
+    Stream new blocks and mempool changes over a WebSocket, one JSON event per message
+    Same filters and lagged events as /events
+    """
+    try:
+        subscription = _subscribe(types, address)
+    except HTTPException as e:
+        # 1008 = policy violation (bad filter), 1013 = try again later (subscriber limit)
+        await websocket.close(code=1008 if e.status_code == 400 else 1013, reason=e.detail)
+        return
+    except ServiceNotReady as e:
+        await websocket.close(code=1013, reason=str(e))
+        return
+    
+    events = services.blockchain_service.events
+    await websocket.accept()
+    
+    async def wait_for_disconnect():
+        while (await websocket.receive())['type'] != 'websocket.disconnect':
+            pass
+    
+    disconnected = asyncio.create_task(wait_for_disconnect())
+    try:
+        while True:
+            next_event = asyncio.create_task(subscription.get())
+            await asyncio.wait({next_event, disconnected}, return_when=asyncio.FIRST_COMPLETED)
+            
+            if disconnected.done():
+                next_event.cancel()
+                break
+            
+            event = next_event.result()
+            if event is None:
+                # 1001 = going away (server shutdown)
+                await websocket.close(code=1001)
+                break
+            await websocket.send_text(dumps(event).decode())
+    finally:
+        disconnected.cancel()
+        events.unsubscribe(subscription)
+
+
 @router.get("/stats", response_model=dict)
 async def get_stats():
     """Get blockchain statistics"""
-    return blockchain_service.get_stats()
+    return await services.blockchain_service.get_stats_async()
 
 
-@router.post("/balance", response_model=BalanceResponse)
+@router.post("/balance", response_model=BalanceResponse, response_model_exclude_none=True)
 async def get_balance(request: BalanceRequest):
-    """Get balance for an address"""
-    result = blockchain_service.get_balance(request.address)
+    """Get balance for an address (set include_transactions for the history)"""
+    result = await services.blockchain_service.get_balance_async(
+        request.address,
+        include_transactions=request.include_transactions
+    )
     return result
 
 
+@router.post("/balances", response_model=BalancesResponse)
+async def get_balances(request: BalancesRequest):
+    """Get balances for many addresses in one request"""
+    return services.blockchain_service.get_balances(request.addresses)
+
+
 @router.post("/reset", response_model=MessageResponse)
 async def reset_blockchain():
     """
     Reset blockchain to genesis block
     WARNING: This will delete all blocks and transactions!
     """
-    result = blockchain_service.reset_blockchain()
+    # Queued jobs would mine on the new chain, the running one is cancelled by the reset
+    services.mining_job_manager.cancel_all()
+    # Deleting the stored chain and mining a new genesis block both block, keep them off the event loop
+    result = await asyncio.to_thread(services.blockchain_service.reset_blockchain)
     
     if not result['success']:
         raise HTTPException(
@@ -4,21 +4,24 @@ Pydantic models for request/response validation
 """
 
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Dict, List, Optional
+from ..config.settings import settings
 
 
 class TransactionCreate(BaseModel):
     """Schema for creating a new transaction"""
     sender: str = Field(..., description="Sender address", min_length=1)
     recipient: str = Field(..., description="Recipient address", min_length=1)
-    amount: float = Field(..., description="Amount to transfer", gt=0)
+    amount: float = Field(..., description="Amount to transfer", gt=0, allow_inf_nan=False)
+    fee: float = Field(0.0, description="Fee paid to the miner (higher fees are mined first)", ge=0, allow_inf_nan=False)
     
     class Config:
         json_schema_extra = {
             "example": {
                 "sender": "Alice",
                 "recipient": "Bob",
-                "amount": 50.0
+                "amount": 50.0,
+                "fee": 0.1
             }
         }
 
@@ -29,6 +32,7 @@ class TransactionResponse(BaseModel):
     recipient: str
     amount: float
     timestamp: float
+    fee: float = 0.0
 
 
 class BlockResponse(BaseModel):
@@ -39,12 +43,22 @@ class BlockResponse(BaseModel):
     timestamp: float
     nonce: int
     hash: str
+    merkle_root: str
+    version: int
 
 
 class ChainResponse(BaseModel):
     """Schema for blockchain response"""
     chain: List[dict]
     length: int
+    next_cursor: Optional[int] = None
+
+
+class BlocksResponse(BaseModel):
+    """Schema for a page of blocks"""
+    blocks: List[dict]
+    length: int
+    next_cursor: Optional[int] = None
 
 
 class MineRequest(BaseModel):
@@ -74,6 +88,7 @@ class StatsResponse(BaseModel):
 class BalanceRequest(BaseModel):
     """Schema for balance request"""
     address: str = Field(..., description="Wallet address", min_length=1)
+    include_transactions: bool = Field(False, description="Include the transaction history")
     
     class Config:
         json_schema_extra = {
@@ -88,6 +103,35 @@ class BalanceResponse(BaseModel):
     address: str
     balance: float
     transaction_count: int
+    transactions: Optional[List[dict]] = None
+
+
+class BalancesRequest(BaseModel):
+    """Schema for batch balance request"""
+    addresses: List[str] = Field(
+        ...,
+        description="Wallet addresses",
+        min_length=1,
+        max_length=settings.MAX_BALANCE_ADDRESSES
+    )
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "addresses": ["Alice", "Bob", "Charlie"]
+            }
+        }
+
+
+class AccountBalance(BaseModel):
+    """Schema for the balance of one address in a batch response"""
+    balance: float
+    transaction_count: int
+
+
+class BalancesResponse(BaseModel):
+    """Schema for batch balance response"""
+    balances: Dict[str, AccountBalance]
 
 
 class MessageResponse(BaseModel):
@@ -26,6 +26,80 @@ class Settings(BaseSettings):
     MINING_DIFFICULTY: int = int(os.getenv("MINING_DIFFICULTY", "4"))
     MINING_REWARD: float = float(os.getenv("MINING_REWARD", "10.0"))
     
+    # Mempool and block size limits
+    MEMPOOL_MAX_SIZE: int = int(os.getenv("MEMPOOL_MAX_SIZE", "50000"))
+    MEMPOOL_SHARDS: int = int(os.getenv("MEMPOOL_SHARDS", "16"))
+    MAX_BLOCK_TRANSACTIONS: int = int(os.getenv("MAX_BLOCK_TRANSACTIONS", "1000"))
+    MAX_BLOCK_BYTES: int = int(os.getenv("MAX_BLOCK_BYTES", "1000000"))
+    
+    # Mining engine: "serial" (request thread) or "parallel" (process pool)
+    MINING_ENGINE: str = os.getenv("MINING_ENGINE", "serial")
+    # Worker processes for the parallel engine (0 = all CPU cores)
+    MINING_WORKERS: int = int(os.getenv("MINING_WORKERS", "0"))
+    # Maximum number of queued + running background mining jobs
+    MINING_MAX_JOBS: int = int(os.getenv("MINING_MAX_JOBS", "4"))
+    # Number of finished mining jobs kept for status queries
+    MINING_JOB_HISTORY: int = int(os.getenv("MINING_JOB_HISTORY", "100"))
+    
+    # Worker processes for full chain validation (1 = serial, 0 = all CPU cores)
+    VALIDATION_WORKERS: int = int(os.getenv("VALIDATION_WORKERS", "1"))
+    
+    # Chain load mode: "trust" (take stored hashes as is) or "verify" (full validation before serving)
+    CHAIN_LOAD_MODE: str = os.getenv("CHAIN_LOAD_MODE", "trust")
+    # In "trust" mode, validate blocks past the checkpoint in the background after loading
+    BACKGROUND_VALIDATION: bool = os.getenv("BACKGROUND_VALIDATION", "false").lower() in ("1", "true", "yes")
+    
+    # File storing the "validated up to height" checkpoint (empty = memory only)
+    VALIDATION_CHECKPOINT_FILE: str = os.getenv("VALIDATION_CHECKPOINT_FILE", ".validation_checkpoint.json")
+    
+    # Maximum number of transactions in one POST /api/transactions/batch request
+    MAX_TRANSACTION_BATCH: int = int(os.getenv("MAX_TRANSACTION_BATCH", "10000"))
+    
+    # Blocks per page of GET /api/blocks by default, and the largest page (also caps GET /api/chain)
+    BLOCKS_PAGE_SIZE: int = int(os.getenv("BLOCKS_PAGE_SIZE", "100"))
+    BLOCKS_MAX_PAGE_SIZE: int = int(os.getenv("BLOCKS_MAX_PAGE_SIZE", "1000"))
+    
+    # Number of serialized blocks kept in the LRU block cache (0 = disabled)
+    BLOCK_CACHE_SIZE: int = int(os.getenv("BLOCK_CACHE_SIZE", "10000"))
+    
+    # Maximum number of addresses in one POST /api/balances request
+    MAX_BALANCE_ADDRESSES: int = int(os.getenv("MAX_BALANCE_ADDRESSES", "1000"))
+    
+    # Storage backend: "supabase" (remote) or "sqlite" (embedded, single node)
+    STORAGE_BACKEND: str = os.getenv("STORAGE_BACKEND", "supabase")
+    # Database file for the sqlite backend
+    SQLITE_PATH: str = os.getenv("SQLITE_PATH", "blockchain.db")
+    
+    # Pooled keep-alive connections and request timeout (seconds) of the async Supabase client
+    DB_MAX_CONNECTIONS: int = int(os.getenv("DB_MAX_CONNECTIONS", "20"))
+    DB_TIMEOUT: float = float(os.getenv("DB_TIMEOUT", "10.0"))
+    
+    # Rows per bulk insert request when saving a block's transactions
+    DB_INSERT_CHUNK_SIZE: int = int(os.getenv("DB_INSERT_CHUNK_SIZE", "1000"))
+    
+    # Blocks per page when loading the chain, and whether to fetch the next page ahead
+    DB_PAGE_SIZE: int = int(os.getenv("DB_PAGE_SIZE", "1000"))
+    DB_PREFETCH: bool = os.getenv("DB_PREFETCH", "true").lower() in ("1", "true", "yes")
+    
+    # Local binary snapshot of the persisted chain, loaded before Supabase on startup (empty = disabled)
+    SNAPSHOT_FILE: str = os.getenv("SNAPSHOT_FILE", "chain.snapshot")
+    
+    # Background persistence of mined blocks
+    PERSISTENCE_BATCH_SIZE: int = int(os.getenv("PERSISTENCE_BATCH_SIZE", "16"))
+    PERSISTENCE_RETRY_DELAY: float = float(os.getenv("PERSISTENCE_RETRY_DELAY", "0.5"))
+    PERSISTENCE_MAX_RETRY_DELAY: float = float(os.getenv("PERSISTENCE_MAX_RETRY_DELAY", "30.0"))
+    # Seconds to wait for queued blocks to be written on shutdown
+    PERSISTENCE_FLUSH_TIMEOUT: float = float(os.getenv("PERSISTENCE_FLUSH_TIMEOUT", "10.0"))
+    
+    # Seconds a database row count is reused in /api/stats (0 = never count in the database)
+    STATS_DB_COUNT_TTL: float = float(os.getenv("STATS_DB_COUNT_TTL", "60"))
+    
+    # Event subscriptions (WebSocket/SSE): undelivered events per subscriber, subscriber
+    # limit, and seconds between SSE keep-alive comments
+    EVENT_QUEUE_SIZE: int = int(os.getenv("EVENT_QUEUE_SIZE", "1000"))
+    EVENT_MAX_SUBSCRIBERS: int = int(os.getenv("EVENT_MAX_SUBSCRIBERS", "1000"))
+    EVENT_KEEPALIVE: float = float(os.getenv("EVENT_KEEPALIVE", "15"))
+    
     # API Configuration
     API_TITLE: str = "Blockchain API"
     API_VERSION: str = "1.0.0"
@@ -3,10 +3,46 @@ FastAPI Main Application
 Entry point for the blockchain API
 """
 
-from fastapi import FastAPI
+import math
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from .api.routes import router
 from .config.settings import settings
+from .services.container import services, ServiceNotReady
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start loading the blockchain in the background and shut it down on exit"""
+    print("=" * 60)
+    print("🚀 Blockchain API Starting...")
+    print("=" * 60)
+    print(f"📊 Mining Difficulty: {settings.MINING_DIFFICULTY}")
+    print(f"⛏️  Mining Engine: {settings.MINING_ENGINE}")
+    print(f"💰 Mining Reward: {settings.MINING_REWARD}")
+    if settings.STORAGE_BACKEND.lower() == "sqlite":
+        print(f"🗄️  Storage: SQLite ({settings.SQLITE_PATH})")
+    else:
+        print(f"🗄️  Supabase URL: {settings.SUPABASE_URL}")
+    print("=" * 60)
+    print("⏳ Loading blockchain in the background (see /ready)")
+    print("📚 API Documentation: http://localhost:8000/docs")
+    print("=" * 60)
+    
+    # The chain loads on its own thread, so the port is bound right away
+    services.start()
+    
+    yield
+    
+    print("\n" + "=" * 60)
+    print("👋 Blockchain API Shutting Down...")
+    print("=" * 60)
+    await services.shutdown()
+
 
 # Create FastAPI application
 app = FastAPI(
@@ -14,7 +50,8 @@ app = FastAPI(
     version=settings.API_VERSION,
     description=settings.API_DESCRIPTION,
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -30,27 +67,38 @@ app.add_middleware(
 app.include_router(router)
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Run on application startup"""
-    print("=" * 60)
-    print("🚀 Blockchain API Starting...")
-    print("=" * 60)
-    print(f"📊 Mining Difficulty: {settings.MINING_DIFFICULTY}")
-    print(f"💰 Mining Reward: {settings.MINING_REWARD}")
-    print(f"🗄️  Supabase URL: {settings.SUPABASE_URL}")
-    print("=" * 60)
-    print("✓ Blockchain loaded and ready")
-    print("📚 API Documentation: http://localhost:8000/docs")
-    print("=" * 60)
+@app.exception_handler(ServiceNotReady)
+async def service_not_ready_handler(request: Request, exc: ServiceNotReady):
+    """Answer 503 while the blockchain is still loading"""
+    return JSONResponse(
+        status_code=503,
+        content={
+            "success": False,
+            "message": str(exc),
+            "data": services.get_status()
+        },
+        headers={"Retry-After": "1"}
+    )
 
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Run on application shutdown"""
-    print("\n" + "=" * 60)
-    print("👋 Blockchain API Shutting Down...")
-    print("=" * 60)
+def _quote_non_finite(value):
+    """Replace NaN and Infinity (accepted by the JSON parser) with strings, recursively"""
+    if isinstance(value, float) and not math.isfinite(value):
+        return str(value)
+    if isinstance(value, dict):
+        return {key: _quote_non_finite(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_quote_non_finite(item) for item in value]
+    return value
+
+
+@app.exception_handler(RequestValidationError)
+async def validation_error_handler(request: Request, exc: RequestValidationError):
+    """Answer 422 like FastAPI does, echoing a rejected NaN or Infinity as a string"""
+    return JSONResponse(
+        status_code=422,
+        content={"detail": _quote_non_finite(jsonable_encoder(exc.errors()))}
+    )
 
 
 @app.get("/")
@@ -73,11 +121,23 @@ async def health_check():
     }
 
 
+@app.get("/ready")
+async def readiness_check():
+    """Readiness endpoint, 503 until the blockchain is loaded"""
+    status = services.get_status()
+    return JSONResponse(
+        status_code=200 if status["ready"] else 503,
+        content=status
+    )
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True
+        reload=True,
+        # Open event streams (/api/events) would otherwise hold up shutdown
+        timeout_graceful_shutdown=5
     )
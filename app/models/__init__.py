@@ -2,8 +2,26 @@
 Blockchain Models
 """
 
-from .block import Block
+from .block import Block, BlockHeader
 from .blockchain import Blockchain
+from .mempool import Mempool
+from .miner import MiningCancelled, MiningResult, ParallelMiner, SerialMiner, create_miner
+from .state import BalanceIndex
 from .transaction import Transaction
+from .validation import ChainValidator, ValidationReport
 
-__all__ = ['Block', 'Blockchain', 'Transaction']
+__all__ = [
+    'BalanceIndex',
+    'Block',
+    'BlockHeader',
+    'Blockchain',
+    'ChainValidator',
+    'Mempool',
+    'MiningCancelled',
+    'MiningResult',
+    'ParallelMiner',
+    'SerialMiner',
+    'Transaction',
+    'ValidationReport',
+    'create_miner'
+]
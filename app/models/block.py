@@ -5,11 +5,126 @@ Represents a single block in the blockchain
 
 import hashlib
 import json
+import struct
 import time
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+from .pow import NONCE_FORMAT, search_nonce
 from .transaction import Transaction
 
 
+# Block version 1 hashes the full JSON body (blocks mined before the header split),
+# version 2 hashes the fixed-size header only
+LEGACY_BLOCK_VERSION = 1
+BLOCK_VERSION = 2
+
+# Merkle root of a block without transactions
+EMPTY_MERKLE_ROOT = '0' * 64
+
+
+def compute_merkle_root(tx_hashes: List[str]) -> str:
+    """
+    Compute the Merkle root over a list of transaction hashes
+    
+    Args:
+        tx_hashes: Hexadecimal transaction hashes in block order
+        
+    Returns:
+        Hexadecimal Merkle root
+    """
+    if not tx_hashes:
+        return EMPTY_MERKLE_ROOT
+    
+    level = [bytes.fromhex(tx_hash) for tx_hash in tx_hashes]
+    
+    while len(level) > 1:
+        # Duplicate the last node on odd-sized levels
+        if len(level) % 2 == 1:
+            level.append(level[-1])
+        
+        level = [
+            hashlib.sha256(level[i] + level[i + 1]).digest()
+            for i in range(0, len(level), 2)
+        ]
+    
+    return level[0].hex()
+
+
+class BlockHeader:
+    """Fixed-size block header, the only data hashed during proof-of-work"""
+    
+    # version, index, previous_hash, timestamp, merkle_root, nonce (92 bytes)
+    FORMAT = struct.Struct('>IQ32sd32sQ')
+    
+    # Everything except the trailing nonce
+    PREFIX_FORMAT = struct.Struct('>IQ32sd32s')
+    NONCE_FORMAT = NONCE_FORMAT
+    
+    def __init__(
+        self,
+        version: int,
+        index: int,
+        previous_hash: str,
+        timestamp: float,
+        merkle_root: str,
+        nonce: int = 0
+    ):
+        """
+        Initialize a block header
+        
+        Args:
+            version: Block format version
+            index: Position of the block in the chain
+            previous_hash: Hash of the previous block
+            timestamp: Block creation timestamp
+            merkle_root: Merkle root of the block transactions
+            nonce: Proof-of-work nonce
+        """
+        self.version = version
+        self.index = index
+        self.previous_hash = previous_hash
+        self.timestamp = timestamp
+        self.merkle_root = merkle_root
+        self.nonce = nonce
+    
+    @staticmethod
+    def _hash_to_bytes(hash_string: str) -> bytes:
+        """Convert a hexadecimal hash (the genesis uses "0") to 32 raw bytes"""
+        return bytes.fromhex(hash_string.zfill(64))
+    
+    def serialize_prefix(self) -> bytes:
+        """
+        Encode the constant part of the header (everything but the nonce)
+        
+        Returns:
+            Canonical header prefix bytes
+        """
+        return self.PREFIX_FORMAT.pack(
+            self.version,
+            self.index,
+            self._hash_to_bytes(self.previous_hash),
+            self.timestamp,
+            self._hash_to_bytes(self.merkle_root)
+        )
+    
+    def serialize(self) -> bytes:
+        """
+        Encode the header into its fixed-size canonical form
+        
+        Returns:
+            Canonical header bytes
+        """
+        return self.serialize_prefix() + self.NONCE_FORMAT.pack(self.nonce)
+    
+    def calculate_hash(self) -> str:
+        """
+        Calculate the SHA-256 hash of the header
+        
+        Returns:
+            Hexadecimal hash string
+        """
+        return hashlib.sha256(self.serialize()).hexdigest()
+
+
 class Block:
     """Represents a block in the blockchain"""
     
@@ -19,7 +134,10 @@ class Block:
         transactions: List[Transaction],
         previous_hash: str,
         timestamp: float = None,
-        nonce: int = 0
+        nonce: int = 0,
+        version: int = BLOCK_VERSION,
+        merkle_root: Optional[str] = None,
+        block_hash: Optional[str] = None
     ):
         """
         Initialize a new block
@@ -30,25 +148,66 @@ class Block:
             previous_hash: Hash of the previous block
             timestamp: Block creation timestamp (defaults to current time)
             nonce: Proof-of-work nonce
+            version: Block format version
+            merkle_root: Known Merkle root (computed from transactions if omitted)
+            block_hash: Known hash (computed if omitted, verification is left to validation)
         """
         self.index = index
         self.transactions = transactions
         self.previous_hash = previous_hash
         self.timestamp = timestamp or time.time()
         self.nonce = nonce
-        self.hash = self.calculate_hash()
+        self.version = version
+        self.merkle_root = merkle_root or self.calculate_merkle_root()
+        self.hash = block_hash or self.calculate_hash()
+    
+    def calculate_merkle_root(self) -> str:
+        """
+        Calculate the Merkle root of the block transactions
+        
+        Returns:
+            Hexadecimal Merkle root
+        """
+        return compute_merkle_root([tx.calculate_hash() for tx in self.transactions])
+    
+    @property
+    def header(self) -> BlockHeader:
+        """Header of the block"""
+        return BlockHeader(
+            version=self.version,
+            index=self.index,
+            previous_hash=self.previous_hash,
+            timestamp=self.timestamp,
+            merkle_root=self.merkle_root,
+            nonce=self.nonce
+        )
     
     def calculate_hash(self) -> str:
         """
         Calculate the SHA-256 hash of the block
         
+        Only the fixed-size header is hashed, so the cost does not depend on
+        the number of transactions. Legacy blocks keep their full-body hash.
+        
+        Returns:
+            Hexadecimal hash string
+        """
+        if self.version == LEGACY_BLOCK_VERSION:
+            return self._calculate_legacy_hash()
+        
+        return self.header.calculate_hash()
+    
+    def _calculate_legacy_hash(self) -> str:
+        """
+        Calculate the version 1 hash over the full JSON block body
+        
         Returns:
             Hexadecimal hash string
         """
         # Create a dictionary of block data
         block_data = {
             'index': self.index,
-            'transactions': [tx.to_dict() for tx in self.transactions],
+            'transactions': [tx.canonical_dict() for tx in self.transactions],
             'previous_hash': self.previous_hash,
             'timestamp': self.timestamp,
             'nonce': self.nonce
@@ -60,20 +219,35 @@ class Block:
         # Calculate SHA-256 hash
         return hashlib.sha256(block_string.encode()).hexdigest()
     
-    def mine_block(self, difficulty: int) -> None:
+    def mine_block(self, difficulty: int, cancel_event=None) -> bool:
         """
         Mine the block using proof-of-work
         
         Args:
             difficulty: Number of leading zeros required in hash
+            cancel_event: Optional threading.Event that aborts mining when set
+            
+        Returns:
+            True if the block was mined, False if mining was cancelled
         """
-        target = '0' * difficulty
+        if self.version == LEGACY_BLOCK_VERSION:
+            raise ValueError("Legacy blocks can't be mined, use the current block version")
+        
+        nonce, block_hash, _ = search_nonce(
+            self.header.serialize_prefix(),
+            difficulty,
+            start=self.nonce,
+            stop_event=cancel_event
+        )
         
-        while self.hash[:difficulty] != target:
-            self.nonce += 1
-            self.hash = self.calculate_hash()
+        if nonce is None:
+            return False
+        
+        self.nonce = nonce
+        self.hash = block_hash
         
         print(f"Block mined: {self.hash}")
+        return True
     
     def is_valid(self) -> bool:
         """
@@ -82,6 +256,10 @@ class Block:
         Returns:
             True if block is valid, False otherwise
         """
+        # Check if the Merkle root commits to the transactions
+        if self.merkle_root != self.calculate_merkle_root():
+            return False
+        
         # Check if hash is correct
         if self.hash != self.calculate_hash():
             return False
@@ -106,7 +284,27 @@ class Block:
             'previous_hash': self.previous_hash,
             'timestamp': self.timestamp,
             'nonce': self.nonce,
-            'hash': self.hash
+            'hash': self.hash,
+            'merkle_root': self.merkle_root,
+            'version': self.version
+        }
+    
+    def to_header_dict(self) -> Dict[str, Any]:
+        """
+        Convert the block header to a dictionary (transactions are only counted)
+        
+        Returns:
+            Dictionary representation of the block header
+        """
+        return {
+            'index': self.index,
+            'transaction_count': len(self.transactions),
+            'previous_hash': self.previous_hash,
+            'timestamp': self.timestamp,
+            'nonce': self.nonce,
+            'hash': self.hash,
+            'merkle_root': self.merkle_root,
+            'version': self.version
         }
     
     @classmethod
@@ -114,6 +312,9 @@ class Block:
         """
         Create block from dictionary
         
+        The saved hash is taken as is without rehashing the block; use chain
+        validation to verify loaded blocks.
+        
         Args:
             data: Dictionary containing block data
             
@@ -127,12 +328,14 @@ class Block:
             transactions=transactions,
             previous_hash=data['previous_hash'],
             timestamp=data['timestamp'],
-            nonce=data['nonce']
+            nonce=data['nonce'],
+            # Rows stored before the header split carry no version
+            version=data.get('version') or LEGACY_BLOCK_VERSION,
+            merkle_root=data.get('merkle_root'),
+            # Use the hash from saved data
+            block_hash=data['hash']
         )
         
-        # Set the hash from saved data
-        block.hash = data['hash']
-        
         return block
     
     def __repr__(self) -> str:
@@ -3,26 +3,65 @@ Blockchain Model
 Manages the entire blockchain
 """
 
+import threading
 from typing import List, Dict, Any, Optional
 from .block import Block
+from .mempool import Mempool
+from .miner import MiningResult, SerialMiner
+from .state import BalanceIndex
 from .transaction import Transaction
+from .validation import ChainValidator, ValidationReport
 
 
 class Blockchain:
     """Manages the blockchain and its operations"""
     
-    def __init__(self, difficulty: int = 4, mining_reward: float = 10.0):
+    def __init__(
+        self,
+        difficulty: int = 4,
+        mining_reward: float = 10.0,
+        miner=None,
+        validator: Optional[ChainValidator] = None,
+        mempool_size: int = 50000,
+        max_block_transactions: int = 1000,
+        max_block_bytes: int = 1000000,
+        mempool_shards: int = 16
+    ):
         """
         Initialize a new blockchain
         
         Args:
             difficulty: Mining difficulty (number of leading zeros)
             mining_reward: Reward for mining a block
+            miner: Mining engine (defaults to a single-core SerialMiner)
+            validator: Chain validation engine (defaults to a serial ChainValidator)
+            mempool_size: Maximum number of pending transactions
+            max_block_transactions: Maximum transactions per block (including the reward)
+            max_block_bytes: Maximum serialized size of the pending transactions in a block
+            mempool_shards: Number of independently locked mempool shards
         """
         self.chain: List[Block] = []
-        self.pending_transactions: List[Transaction] = []
+        self.pending_transactions = Mempool(max_size=mempool_size, shards=mempool_shards)
+        self.max_block_transactions = max_block_transactions
+        self.max_block_bytes = max_block_bytes
+        
+        # Serializes everything that extends the chain (mining, add_block);
+        # transaction submission only touches the mempool shard locks
+        self._chain_lock = threading.RLock()
         self.difficulty = difficulty
         self.mining_reward = mining_reward
+        self.miner = miner or SerialMiner()
+        self.validator = validator or ChainValidator()
+        
+        # Balances and transaction counts of every address in the chain
+        self.state = BalanceIndex()
+        # Number of transactions in the chain, kept up to date on append
+        self.transaction_count = 0
+        self.last_mining_result: Optional[MiningResult] = None
+        
+        # Highest block height (and its hash) already verified by is_chain_valid
+        self.validated_height = 0
+        self.validated_hash: Optional[str] = None
         
         # Create genesis block if chain is empty
         if not self.chain:
@@ -40,8 +79,8 @@ class Blockchain:
             transactions=[],
             previous_hash="0"
         )
-        genesis_block.mine_block(self.difficulty)
-        self.chain.append(genesis_block)
+        self.last_mining_result = self.miner.mine(genesis_block, self.difficulty)
+        self._append_block(genesis_block)
         return genesis_block
     
     def get_latest_block(self) -> Block:
@@ -63,48 +102,83 @@ class Blockchain:
         Returns:
             True if transaction was added, False otherwise
         """
-        if not transaction.is_valid():
-            return False
-        
-        self.pending_transactions.append(transaction)
-        return True
+        return self.submit_transaction(transaction) is None
     
-    def mine_pending_transactions(self, mining_reward_address: str) -> Block:
+    def submit_transaction(self, transaction: Transaction) -> Optional[str]:
         """
-        Mine all pending transactions into a new block
+        Add a transaction to the mempool and report why it was rejected
         
         Args:
-            mining_reward_address: Address to receive mining reward
+            transaction: Transaction to add
             
         Returns:
-            The newly mined block
+            None if the transaction was added, otherwise the rejection reason
         """
-        # Add mining reward transaction
-        reward_transaction = Transaction(
-            sender="SYSTEM",
-            recipient=mining_reward_address,
-            amount=self.mining_reward
-        )
-        self.pending_transactions.append(reward_transaction)
-        
-        # Create new block
-        new_block = Block(
-            index=len(self.chain),
-            transactions=self.pending_transactions,
-            previous_hash=self.get_latest_block().hash
-        )
-        
-        # Mine the block
-        print(f"Mining block {new_block.index}...")
-        new_block.mine_block(self.difficulty)
+        return self.pending_transactions.add(transaction)
+    
+    def submit_transactions(self, transactions: List[Transaction]) -> List[Optional[str]]:
+        """
+        Add many transactions to the mempool in one pass
         
-        # Add to chain
-        self.chain.append(new_block)
+        Args:
+            transactions: Transactions to add
+            
+        Returns:
+            Rejection reason for each transaction (None where it was added)
+        """
+        add = self.pending_transactions.add
+        return [add(transaction) for transaction in transactions]
+    
+    def mine_pending_transactions(self, mining_reward_address: str, cancel_event=None) -> Block:
+        """
+        Mine the highest-priority pending transactions into a new block
         
-        # Clear pending transactions
-        self.pending_transactions = []
+        Transactions are picked by fee rate within the block limits, the rest
+        stay pending for the next block.
         
-        return new_block
+        Args:
+            mining_reward_address: Address to receive mining reward
+            cancel_event: Optional threading.Event that aborts mining when set
+            
+        Returns:
+            The newly mined block
+            
+        Raises:
+            MiningCancelled: If mining was cancelled (pending transactions are kept)
+        """
+        with self._chain_lock:
+            # Immutable snapshot of the best pending transactions, keeping one
+            # slot for the reward; new submissions go on into the mempool
+            selected = self.pending_transactions.select(
+                self.max_block_transactions - 1,
+                self.max_block_bytes
+            )
+            
+            # Add mining reward transaction (block reward plus the fees)
+            reward_transaction = Transaction(
+                sender="SYSTEM",
+                recipient=mining_reward_address,
+                amount=self.mining_reward + sum(tx.fee for tx in selected)
+            )
+            
+            # Create new block
+            new_block = Block(
+                index=len(self.chain),
+                transactions=[*selected, reward_transaction],
+                previous_hash=self.get_latest_block().hash
+            )
+            
+            # Mine the block
+            print(f"Mining block {new_block.index}...")
+            self.last_mining_result = self.miner.mine(new_block, self.difficulty, cancel_event)
+            
+            # Add to chain
+            self._append_block(new_block)
+            
+            # Remove the mined transactions from the mempool
+            self.pending_transactions.remove(selected)
+            
+            return new_block
     
     def add_block(self, block: Block) -> bool:
         """
@@ -119,45 +193,97 @@ class Blockchain:
         if not block.is_valid():
             return False
         
-        # Verify previous hash matches
-        if self.chain and block.previous_hash != self.get_latest_block().hash:
-            return False
-        
+        with self._chain_lock:
+            # Verify previous hash matches
+            if self.chain and block.previous_hash != self.get_latest_block().hash:
+                return False
+            
+            self._append_block(block)
+            return True
+    
+    def _append_block(self, block: Block) -> None:
+        """Append a block and apply it to the balance index"""
         self.chain.append(block)
-        return True
+        self.state.apply_block(block)
+        self.transaction_count += len(block.transactions)
+    
+    def rebuild_state(self) -> None:
+        """Rebuild the balance index and counters from the chain (after loading blocks)"""
+        self.state.rebuild(self.chain)
+        self.transaction_count = sum(len(block.transactions) for block in self.chain)
     
-    def is_chain_valid(self) -> bool:
+    def is_chain_valid(self, full: bool = False) -> bool:
         """
-        Validate the entire blockchain
+        Validate the blockchain
         
+        Args:
+            full: Re-verify the entire chain and ignore the checkpoint
+            
         Returns:
             True if chain is valid, False otherwise
         """
-        for i in range(1, len(self.chain)):
-            current_block = self.chain[i]
-            previous_block = self.chain[i - 1]
-            
-            # Validate current block
-            if not current_block.is_valid():
-                print(f"Block {i} is invalid")
-                return False
-            
-            # Check if hash matches
-            if current_block.hash != current_block.calculate_hash():
-                print(f"Block {i} hash mismatch")
-                return False
-            
-            # Check if previous hash matches
-            if current_block.previous_hash != previous_block.hash:
-                print(f"Block {i} previous hash mismatch")
-                return False
+        return self.validate_chain(full=full).valid
+    
+    def validate_chain(self, full: bool = False) -> ValidationReport:
+        """
+        Validate the blockchain and report every invalid block
+        
+        Blocks up to the validation checkpoint are skipped unless full is set,
+        so repeated calls only verify blocks appended since the last call.
+        
+        Args:
+            full: Re-verify the entire chain and ignore the checkpoint
             
-            # Check proof-of-work
-            if not current_block.hash.startswith('0' * self.difficulty):
-                print(f"Block {i} doesn't meet difficulty requirement")
-                return False
+        Returns:
+            Validation report
+        """
+        start = 1
+        if not full and self._has_valid_checkpoint():
+            start = self.validated_height + 1
+        
+        report = self.validator.validate(self.chain, self.difficulty, start)
+        
+        if report.valid:
+            self.set_validation_checkpoint(len(self.chain) - 1)
+        else:
+            for index, reason in report.errors:
+                print(f"Block {index} is invalid: {reason}")
+            self.set_validation_checkpoint(report.first_invalid_height - 1)
+        
+        return report
+    
+    def _has_valid_checkpoint(self) -> bool:
+        """Check that the checkpoint still points at a block of this chain"""
+        return (
+            0 < self.validated_height < len(self.chain)
+            and self.chain[self.validated_height].hash == self.validated_hash
+        )
+    
+    def set_validation_checkpoint(self, height: int, block_hash: Optional[str] = None) -> None:
+        """
+        Record the highest verified block
+        
+        Args:
+            height: Height of the last verified block
+            block_hash: Hash of that block (read from the chain if omitted)
+        """
+        if block_hash is None and 0 <= height < len(self.chain):
+            block_hash = self.chain[height].hash
+        
+        self.validated_height = max(height, 0)
+        self.validated_hash = block_hash
+    
+    def get_validation_checkpoint(self) -> Dict[str, Any]:
+        """
+        Get the validation checkpoint
         
-        return True
+        Returns:
+            Dictionary with the validated height and tip hash
+        """
+        return {
+            'height': self.validated_height,
+            'hash': self.validated_hash
+        }
     
     def get_balance(self, address: str) -> float:
         """
@@ -169,16 +295,19 @@ class Blockchain:
         Returns:
             Current balance
         """
-        balance = 0.0
-        
-        for block in self.chain:
-            for transaction in block.transactions:
-                if transaction.sender == address:
-                    balance -= transaction.amount
-                if transaction.recipient == address:
-                    balance += transaction.amount
+        return self.state.get_balance(address)
+    
+    def get_balances(self, addresses: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the balances of many addresses in one pass over the balance index
         
-        return balance
+        Args:
+            addresses: Addresses to check
+            
+        Returns:
+            Dictionary of address -> balance and transaction count
+        """
+        return self.state.get_accounts(addresses)
     
     def get_block_by_index(self, index: int) -> Optional[Block]:
         """
@@ -201,12 +330,11 @@ class Blockchain:
         Returns:
             Dictionary containing blockchain stats
         """
-        total_transactions = sum(len(block.transactions) for block in self.chain)
-        
         return {
             'total_blocks': len(self.chain),
-            'total_transactions': total_transactions,
+            'total_transactions': self.transaction_count,
             'pending_transactions': len(self.pending_transactions),
+            'mempool': self.pending_transactions.get_stats(),
             'difficulty': self.difficulty,
             'mining_reward': self.mining_reward,
             'latest_block_hash': self.get_latest_block().hash if self.chain else None
@@ -250,9 +378,10 @@ class Blockchain:
             block = Block.from_dict(block_data)
             blockchain.chain.append(block)
         
+        blockchain.rebuild_state()
+        
         # Load pending transactions
-        blockchain.pending_transactions = [
-            Transaction.from_dict(tx) for tx in data.get('pending_transactions', [])
-        ]
+        for tx in data.get('pending_transactions', []):
+            blockchain.add_transaction(Transaction.from_dict(tx))
         
         return blockchain
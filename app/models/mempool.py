@@ -0,0 +1,240 @@
+"""
+Mempool Model
+Bounded, fee-prioritized pool of pending transactions
+"""
+
+import heapq
+import itertools
+import threading
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+from .transaction import Transaction
+
+
+# Reasons a transaction is not accepted into the mempool
+REJECT_INVALID = 'invalid'
+REJECT_DUPLICATE = 'duplicate'
+REJECT_FULL = 'mempool_full'
+
+
+class MempoolEntry:
+    """A pending transaction with its priority data"""
+    
+    __slots__ = ('transaction', 'tx_hash', 'size', 'fee_rate', 'sequence')
+    
+    def __init__(self, transaction: Transaction, tx_hash: str, sequence: int):
+        """
+        Initialize a mempool entry
+        
+        Args:
+            transaction: Pending transaction
+            tx_hash: Transaction hash (mempool key)
+            sequence: Arrival order
+        """
+        self.transaction = transaction
+        self.tx_hash = tx_hash
+        self.size = transaction.size
+        self.fee_rate = transaction.fee / self.size
+        self.sequence = sequence
+    
+    def priority(self) -> Tuple[float, int]:
+        """Sort key for block selection: highest fee rate first, then oldest"""
+        return (-self.fee_rate, self.sequence)
+
+
+class _MempoolShard:
+    """One lock-protected slice of the mempool"""
+    
+    def __init__(self, max_size: int):
+        """
+        Initialize a shard
+        
+        Args:
+            max_size: Maximum number of entries in this shard
+        """
+        self.max_size = max_size
+        self.entries: Dict[str, MempoolEntry] = {}
+        # Min-heap of (fee_rate, -sequence, tx_hash), stale items are skipped lazily
+        self.eviction_heap: List[Tuple[float, int, str]] = []
+        self.total_bytes = 0
+        self.lock = threading.Lock()
+    
+    def add(self, entry: MempoolEntry) -> Optional[str]:
+        """Insert an entry, evicting the lowest fee rate when full (lock held by caller)"""
+        if entry.tx_hash in self.entries:
+            return REJECT_DUPLICATE
+        
+        if len(self.entries) >= self.max_size:
+            lowest = self._peek_lowest()
+            if lowest is None or entry.fee_rate <= lowest.fee_rate:
+                return REJECT_FULL
+            self.discard(lowest.tx_hash)
+        
+        self.entries[entry.tx_hash] = entry
+        self.total_bytes += entry.size
+        heapq.heappush(self.eviction_heap, (entry.fee_rate, -entry.sequence, entry.tx_hash))
+        return None
+    
+    def _peek_lowest(self) -> Optional[MempoolEntry]:
+        """Get the entry evicted first, dropping stale heap items"""
+        heap = self.eviction_heap
+        while heap:
+            entry = self.entries.get(heap[0][2])
+            if entry is not None and -heap[0][1] == entry.sequence:
+                return entry
+            heapq.heappop(heap)
+        return None
+    
+    def discard(self, tx_hash: str) -> None:
+        """Remove an entry, its heap item becomes stale (lock held by caller)"""
+        entry = self.entries.pop(tx_hash, None)
+        if entry is not None:
+            self.total_bytes -= entry.size
+        
+        # Rebuild the heap once stale items dominate it
+        if len(self.eviction_heap) > 2 * len(self.entries) + 64:
+            self.eviction_heap = [
+                (entry.fee_rate, -entry.sequence, entry.tx_hash)
+                for entry in self.entries.values()
+            ]
+            heapq.heapify(self.eviction_heap)
+    
+    def clear(self) -> None:
+        """Remove every entry (lock held by caller)"""
+        self.entries = {}
+        self.eviction_heap = []
+        self.total_bytes = 0
+
+
+class Mempool:
+    """
+    Pending transactions ordered by fee rate (fee per byte)
+    
+    The pool is split into shards by transaction hash, each with its own lock,
+    so concurrent submissions rarely wait on each other and never on mining.
+    Validation and hashing happen before any lock is taken.
+    
+    When a shard is full, a new transaction evicts its lowest fee-rate entry
+    (the newest one among equal fee rates) only if it pays a higher fee rate;
+    otherwise it is rejected.
+    """
+    
+    def __init__(self, max_size: int = 50000, shards: int = 16):
+        """
+        Initialize a mempool
+        
+        Args:
+            max_size: Maximum number of pending transactions
+            shards: Number of independently locked shards
+        """
+        self.max_size = max_size
+        shard_size = -(-max_size // shards)
+        self._shards = [_MempoolShard(shard_size) for _ in range(shards)]
+        self._sequence = itertools.count()
+    
+    def _shard(self, tx_hash: str) -> _MempoolShard:
+        """Get the shard owning a transaction hash"""
+        return self._shards[int(tx_hash[:8], 16) % len(self._shards)]
+    
+    @property
+    def total_bytes(self) -> int:
+        """Serialized size of all pending transactions"""
+        return sum(shard.total_bytes for shard in self._shards)
+    
+    def add(self, transaction: Transaction) -> Optional[str]:
+        """
+        Add a transaction to the pool (thread-safe)
+        
+        Args:
+            transaction: Transaction to add
+            
+        Returns:
+            None if the transaction was added, otherwise the rejection reason
+        """
+        if not transaction.is_valid():
+            return REJECT_INVALID
+        
+        tx_hash = transaction.calculate_hash()
+        entry = MempoolEntry(transaction, tx_hash, next(self._sequence))
+        shard = self._shard(tx_hash)
+        
+        with shard.lock:
+            return shard.add(entry)
+    
+    def _entries(self) -> List[MempoolEntry]:
+        """Copy the entries of every shard"""
+        entries = []
+        for shard in self._shards:
+            with shard.lock:
+                entries.extend(shard.entries.values())
+        return entries
+    
+    def select(self, max_transactions: int, max_bytes: int) -> Tuple[Transaction, ...]:
+        """
+        Take an immutable snapshot of the best transactions that fit in a block
+        
+        Entries are taken by fee rate (then arrival order); an entry that
+        doesn't fit the remaining byte budget is skipped. The transactions stay
+        in the pool until remove() is called, so submissions keep flowing
+        while the snapshot is being mined.
+        
+        Args:
+            max_transactions: Maximum number of transactions
+            max_bytes: Maximum total serialized size
+            
+        Returns:
+            Selected transactions in priority order
+        """
+        selected = []
+        used_bytes = 0
+        
+        for entry in sorted(self._entries(), key=MempoolEntry.priority):
+            if len(selected) >= max_transactions:
+                break
+            if used_bytes + entry.size > max_bytes:
+                continue
+            selected.append(entry.transaction)
+            used_bytes += entry.size
+        
+        return tuple(selected)
+    
+    def remove(self, transactions: Iterable[Transaction]) -> None:
+        """
+        Remove transactions (after they were mined)
+        
+        Args:
+            transactions: Transactions to remove
+        """
+        for transaction in transactions:
+            tx_hash = transaction.calculate_hash()
+            shard = self._shard(tx_hash)
+            with shard.lock:
+                shard.discard(tx_hash)
+    
+    def clear(self) -> None:
+        """Remove every pending transaction"""
+        for shard in self._shards:
+            with shard.lock:
+                shard.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get mempool statistics
+        
+        Returns:
+            Dictionary with size, capacity, bytes and shard count
+        """
+        return {
+            'size': len(self),
+            'max_size': self.max_size,
+            'bytes': self.total_bytes,
+            'shards': len(self._shards)
+        }
+    
+    def __len__(self) -> int:
+        """Number of pending transactions"""
+        return sum(len(shard.entries) for shard in self._shards)
+    
+    def __iter__(self) -> Iterator[Transaction]:
+        """Iterate over a copy of the pending transactions in arrival order"""
+        entries = sorted(self._entries(), key=lambda entry: entry.sequence)
+        return iter([entry.transaction for entry in entries])
@@ -0,0 +1,271 @@
+"""
+Miner Model
+Proof-of-work mining engines (single-core and multi-core)
+"""
+
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, Any, Optional, Tuple
+from .block import Block
+from .pow import DEFAULT_BATCH_SIZE, search_nonce
+
+
+# Stop flag shared by all worker processes of a pool
+_stop_event = None
+
+# Seconds between two checks of the cancel event while waiting on workers
+CANCEL_POLL_INTERVAL = 0.1
+
+
+class MiningCancelled(Exception):
+    """Raised when a mining run is cancelled before a valid hash is found"""
+
+
+def _init_worker(stop_event) -> None:
+    """Store the pool-wide stop flag in a worker process"""
+    global _stop_event
+    _stop_event = stop_event
+
+
+def _search_nonces(
+    prefix: bytes,
+    difficulty: int,
+    start: int,
+    step: int,
+    batch_size: int
+) -> Tuple[Optional[int], Optional[str], int]:
+    """
+    Search the nonces start, start + step, start + 2 * step, ... in a worker
+    
+    Args:
+        prefix: Serialized header without the nonce
+        difficulty: Number of leading zeros required in hash
+        start: First nonce to try
+        step: Distance between nonces (the number of workers)
+        batch_size: Attempts between two checks of the stop flag
+        
+    Returns:
+        Tuple of (nonce, hash, attempts), nonce and hash are None if stopped
+    """
+    return search_nonce(prefix, difficulty, start, step, batch_size, _stop_event)
+
+
+class MiningResult:
+    """Outcome and statistics of one proof-of-work search"""
+    
+    def __init__(self, nonce: int, hash: str, attempts: int, elapsed: float, workers: int):
+        """
+        Initialize a mining result
+        
+        Args:
+            nonce: Winning nonce
+            hash: Resulting block hash
+            attempts: Total number of hashes computed by all workers
+            elapsed: Wall-clock mining time in seconds
+            workers: Number of workers that took part
+        """
+        self.nonce = nonce
+        self.hash = hash
+        self.attempts = attempts
+        self.elapsed = elapsed
+        self.workers = workers
+    
+    @property
+    def hash_rate(self) -> float:
+        """Hashes per second over all workers"""
+        return self.attempts / self.elapsed if self.elapsed > 0 else 0.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert mining result to dictionary
+        
+        Returns:
+            Dictionary representation of the mining result
+        """
+        return {
+            'nonce': self.nonce,
+            'attempts': self.attempts,
+            'elapsed': self.elapsed,
+            'hash_rate': self.hash_rate,
+            'workers': self.workers
+        }
+
+
+class SerialMiner:
+    """Mines blocks in the calling thread"""
+    
+    workers = 1
+    
+    def mine(self, block: Block, difficulty: int, cancel_event=None) -> MiningResult:
+        """
+        Mine a block using proof-of-work
+        
+        Args:
+            block: Block to mine (nonce and hash are updated in place)
+            difficulty: Number of leading zeros required in hash
+            cancel_event: Optional threading.Event that aborts mining when set
+            
+        Returns:
+            Mining statistics
+            
+        Raises:
+            MiningCancelled: If cancel_event was set before a valid hash was found
+        """
+        start_nonce = block.nonce
+        start = time.perf_counter()
+        
+        if not block.mine_block(difficulty, cancel_event):
+            raise MiningCancelled(f"Mining of block {block.index} cancelled")
+        
+        return MiningResult(
+            nonce=block.nonce,
+            hash=block.hash,
+            attempts=block.nonce - start_nonce + 1,
+            elapsed=time.perf_counter() - start,
+            workers=1
+        )
+    
+    def shutdown(self) -> None:
+        """Release mining resources (nothing to release)"""
+
+
+class ParallelMiner:
+    """Mines blocks by partitioning the nonce space across a process pool"""
+    
+    def __init__(self, workers: int = 0, batch_size: int = DEFAULT_BATCH_SIZE):
+        """
+        Initialize a parallel miner
+        
+        Args:
+            workers: Number of worker processes (0 uses every CPU core)
+            batch_size: Attempts a worker makes between checks of the stop flag
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._stop_event = None
+        self._lock = threading.Lock()
+    
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Start the worker pool on first use"""
+        if self._pool is None:
+            # Spawned workers are safe to start from a threaded server process
+            context = multiprocessing.get_context('spawn')
+            self._stop_event = context.Event()
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(self._stop_event,)
+            )
+        return self._pool
+    
+    def mine(self, block: Block, difficulty: int, cancel_event=None) -> MiningResult:
+        """
+        Mine a block using proof-of-work on all workers
+        
+        Worker i tries the nonces block.nonce + i, block.nonce + i + workers, ...
+        and every worker stops as soon as one of them finds a valid hash.
+        
+        Args:
+            block: Block to mine (nonce and hash are updated in place)
+            difficulty: Number of leading zeros required in hash
+            cancel_event: Optional threading.Event that aborts mining when set
+            
+        Returns:
+            Mining statistics
+            
+        Raises:
+            MiningCancelled: If cancel_event was set before a valid hash was found
+        """
+        # One search at a time, the stop flag is shared by the whole pool
+        with self._lock:
+            pool = self._get_pool()
+            self._stop_event.clear()
+            
+            prefix = block.header.serialize_prefix()
+            start = time.perf_counter()
+            
+            futures = [
+                pool.submit(
+                    _search_nonces,
+                    prefix,
+                    difficulty,
+                    block.nonce + offset,
+                    self.workers,
+                    self.batch_size
+                )
+                for offset in range(self.workers)
+            ]
+            
+            found = None
+            attempts = 0
+            
+            pending = set(futures)
+            
+            try:
+                while pending:
+                    done, pending = wait(
+                        pending,
+                        timeout=CANCEL_POLL_INTERVAL,
+                        return_when=FIRST_COMPLETED
+                    )
+                    
+                    for future in done:
+                        nonce, block_hash, worker_attempts = future.result()
+                        attempts += worker_attempts
+                        
+                        if nonce is not None and found is None:
+                            found = (nonce, block_hash)
+                            self._stop_event.set()
+                    
+                    if cancel_event is not None and cancel_event.is_set():
+                        self._stop_event.set()
+            finally:
+                self._stop_event.set()
+            
+            elapsed = time.perf_counter() - start
+        
+        if found is None:
+            raise MiningCancelled(f"Mining of block {block.index} cancelled")
+        
+        block.nonce, block.hash = found
+        print(f"Block mined: {block.hash}")
+        
+        return MiningResult(
+            nonce=block.nonce,
+            hash=block.hash,
+            attempts=attempts,
+            elapsed=elapsed,
+            workers=self.workers
+        )
+    
+    def shutdown(self) -> None:
+        """Stop the worker pool"""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(cancel_futures=True)
+                self._pool = None
+
+
+def create_miner(engine: str = 'serial', workers: int = 0):
+    """
+    Create a mining engine
+    
+    Args:
+        engine: "serial" or "parallel"
+        workers: Number of worker processes for the parallel engine (0 = all cores)
+        
+    Returns:
+        Miner instance
+    """
+    if engine == 'parallel':
+        return ParallelMiner(workers=workers)
+    
+    if engine == 'serial':
+        return SerialMiner()
+    
+    raise ValueError(f"Unknown mining engine: {engine}")
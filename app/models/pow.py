@@ -0,0 +1,85 @@
+"""
+Proof-of-Work Kernel
+Nonce search over a fixed block header prefix
+"""
+
+import hashlib
+import struct
+from typing import Optional, Tuple
+
+
+# Nonce encoding at the end of the block header
+NONCE_FORMAT = struct.Struct('>Q')
+
+# Nonces evaluated between two checks of the stop flag
+DEFAULT_BATCH_SIZE = 4096
+
+
+def difficulty_target(difficulty: int) -> bytes:
+    """
+    Convert a difficulty into a raw digest target
+    
+    A hex hash with `difficulty` leading zeros is exactly a digest whose
+    big-endian value is below 2 ** (256 - 4 * difficulty), so the check
+    becomes a single bytes comparison.
+    
+    Args:
+        difficulty: Number of leading zeros required in hash
+        
+    Returns:
+        32-byte target, valid digests compare strictly below it
+    """
+    if difficulty <= 0:
+        # Longer than any digest with an all-0xff prefix: everything matches
+        return b'\xff' * 32 + b'\x00'
+    
+    return (1 << (256 - 4 * difficulty)).to_bytes(32, 'big')
+
+
+def search_nonce(
+    prefix: bytes,
+    difficulty: int,
+    start: int = 0,
+    step: int = 1,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    stop_event=None
+) -> Tuple[Optional[int], Optional[str], int]:
+    """
+    Search start, start + step, start + 2 * step, ... for a valid nonce
+    
+    The header prefix is hashed once and its SHA-256 midstate is copied for
+    every nonce, so each attempt only hashes the 8-byte nonce. Nonces are
+    evaluated in batches and the stop flag is only checked between batches.
+    
+    Args:
+        prefix: Serialized header without the nonce
+        difficulty: Number of leading zeros required in hash
+        start: First nonce to try
+        step: Distance between nonces (the number of parallel workers)
+        batch_size: Nonces evaluated between two checks of stop_event
+        stop_event: Optional event (threading or multiprocessing) that stops the search
+        
+    Returns:
+        Tuple of (nonce, hash, attempts), nonce and hash are None if stopped
+    """
+    copy_midstate = hashlib.sha256(prefix).copy
+    pack_nonce = NONCE_FORMAT.pack
+    target = difficulty_target(difficulty)
+    batch_span = batch_size * step
+    nonce = start
+    attempts = 0
+    
+    while stop_event is None or not stop_event.is_set():
+        for candidate in range(nonce, nonce + batch_span, step):
+            sha = copy_midstate()
+            sha.update(pack_nonce(candidate))
+            digest = sha.digest()
+            
+            if digest < target:
+                attempts += (candidate - nonce) // step + 1
+                return candidate, digest.hex(), attempts
+        
+        attempts += batch_size
+        nonce += batch_span
+    
+    return None, None, attempts
@@ -0,0 +1,240 @@
+"""
+Snapshot Model
+Compact binary chain snapshot for fast restarts
+
+Layout (big-endian):
+    header   magic, format version, tip height, tip hash, index offset, body CRC32
+    body     one record per block, in chain order
+    index    byte offset of every block record (for random access over mmap)
+
+A block record is the fixed block fields, the previous hash and the block
+transactions; strings are stored as a 2-byte length followed by UTF-8 bytes.
+"""
+
+import mmap
+import os
+import struct
+import zlib
+from typing import List, Dict, Any, Iterable
+from .block import Block
+from .transaction import Transaction
+
+
+SNAPSHOT_MAGIC = b'BCSNAP\x00\x00'
+SNAPSHOT_VERSION = 1
+
+# magic, format version, tip height, tip hash, index offset, body CRC32
+HEADER_FORMAT = struct.Struct('>8sHQ32sQI')
+
+# version, index, timestamp, nonce, hash, merkle root, transaction count
+BLOCK_FORMAT = struct.Struct('>IQdQ32s32sI')
+
+# amount, fee, timestamp
+TRANSACTION_FORMAT = struct.Struct('>ddd')
+
+STRING_LENGTH = struct.Struct('>H')
+OFFSET_FORMAT = struct.Struct('>Q')
+
+
+class SnapshotError(Exception):
+    """Raised when a snapshot file is missing, corrupt or of an unknown version"""
+    pass
+
+
+def _pack_string(value: str) -> bytes:
+    """Encode a string as a length-prefixed UTF-8 field"""
+    data = value.encode()
+    return STRING_LENGTH.pack(len(data)) + data
+
+
+def _pack_block(block: Block) -> bytes:
+    """
+    Encode one block record
+    
+    Args:
+        block: Block to encode
+        
+    Returns:
+        Record bytes
+    """
+    parts = [
+        BLOCK_FORMAT.pack(
+            block.version,
+            block.index,
+            block.timestamp,
+            block.nonce,
+            bytes.fromhex(block.hash),
+            bytes.fromhex(block.merkle_root),
+            len(block.transactions)
+        ),
+        _pack_string(block.previous_hash)
+    ]
+    
+    for tx in block.transactions:
+        parts.append(TRANSACTION_FORMAT.pack(tx.amount, tx.fee, tx.timestamp))
+        parts.append(_pack_string(tx.sender))
+        parts.append(_pack_string(tx.recipient))
+    
+    return b''.join(parts)
+
+
+def write_snapshot(path: str, blocks: List[Block]) -> None:
+    """
+    Write a snapshot of consecutive blocks starting at the genesis block
+    
+    The file is written next to its destination and moved into place, so a
+    crash never leaves a half-written snapshot behind.
+    
+    Args:
+        path: Snapshot file path
+        blocks: Blocks 0..height in chain order
+    """
+    if not blocks:
+        raise SnapshotError("Cannot snapshot an empty chain")
+    
+    tmp_path = f"{path}.tmp"
+    offsets = []
+    crc = 0
+    position = HEADER_FORMAT.size
+    
+    with open(tmp_path, 'wb') as f:
+        f.seek(position)
+        
+        for block in blocks:
+            record = _pack_block(block)
+            offsets.append(position)
+            f.write(record)
+            crc = zlib.crc32(record, crc)
+            position += len(record)
+        
+        f.write(b''.join(OFFSET_FORMAT.pack(offset) for offset in offsets))
+        
+        f.seek(0)
+        f.write(HEADER_FORMAT.pack(
+            SNAPSHOT_MAGIC,
+            SNAPSHOT_VERSION,
+            blocks[-1].index,
+            bytes.fromhex(blocks[-1].hash),
+            position,
+            crc
+        ))
+        f.flush()
+        os.fsync(f.fileno())
+    
+    os.replace(tmp_path, path)
+
+
+def _read_header(buffer) -> Dict[str, Any]:
+    """Decode and check the snapshot header"""
+    if len(buffer) < HEADER_FORMAT.size:
+        raise SnapshotError("Snapshot is truncated")
+    
+    magic, version, height, tip_hash, index_offset, crc = HEADER_FORMAT.unpack_from(buffer, 0)
+    
+    if magic != SNAPSHOT_MAGIC:
+        raise SnapshotError("Not a chain snapshot")
+    if version != SNAPSHOT_VERSION:
+        raise SnapshotError(f"Unsupported snapshot version {version}")
+    if index_offset + (height + 1) * OFFSET_FORMAT.size != len(buffer):
+        raise SnapshotError("Snapshot is truncated")
+    
+    return {
+        'version': version,
+        'height': height,
+        'tip_hash': tip_hash.hex(),
+        'index_offset': index_offset,
+        'crc': crc
+    }
+
+
+def _unpack_string(buffer, offset: int):
+    """Decode a length-prefixed string, returning (value, next offset)"""
+    (length,) = STRING_LENGTH.unpack_from(buffer, offset)
+    offset += STRING_LENGTH.size
+    return str(buffer[offset:offset + length], 'utf-8'), offset + length
+
+
+def _iter_blocks(buffer, index_offset: int) -> Iterable[Block]:
+    """Decode every block record of the body"""
+    offset = HEADER_FORMAT.size
+    unpack_block = BLOCK_FORMAT.unpack_from
+    unpack_transaction = TRANSACTION_FORMAT.unpack_from
+    
+    while offset < index_offset:
+        version, index, timestamp, nonce, block_hash, merkle_root, tx_count = unpack_block(buffer, offset)
+        previous_hash, offset = _unpack_string(buffer, offset + BLOCK_FORMAT.size)
+        
+        transactions = []
+        for _ in range(tx_count):
+            amount, fee, tx_timestamp = unpack_transaction(buffer, offset)
+            sender, offset = _unpack_string(buffer, offset + TRANSACTION_FORMAT.size)
+            recipient, offset = _unpack_string(buffer, offset)
+            transactions.append(Transaction(sender, recipient, amount, timestamp=tx_timestamp, fee=fee))
+        
+        yield Block(
+            index=index,
+            transactions=transactions,
+            previous_hash=previous_hash,
+            timestamp=timestamp,
+            nonce=nonce,
+            version=version,
+            merkle_root=merkle_root.hex(),
+            block_hash=block_hash.hex()
+        )
+
+
+def read_snapshot_info(path: str) -> Dict[str, Any]:
+    """
+    Read the snapshot header without decoding any block
+    
+    Args:
+        path: Snapshot file path
+        
+    Returns:
+        Dictionary with format version, tip height and tip hash
+    """
+    try:
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            header = _read_header(buffer)
+    except (OSError, ValueError) as e:
+        raise SnapshotError(f"Cannot read snapshot: {e}") from e
+    
+    return {key: header[key] for key in ('version', 'height', 'tip_hash')}
+
+
+def read_snapshot(path: str) -> List[Block]:
+    """
+    Load every block of a snapshot
+    
+    The file is memory-mapped and decoded in place; the body checksum, the
+    heights and the tip hash are checked. Block hashes are taken as stored,
+    like blocks loaded from the database.
+    
+    Args:
+        path: Snapshot file path
+        
+    Returns:
+        Blocks 0..height in chain order
+    """
+    try:
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            header = _read_header(buffer)
+            
+            with memoryview(buffer) as view:
+                body = view[HEADER_FORMAT.size:header['index_offset']]
+                crc = zlib.crc32(body)
+                body.release()
+                
+                if crc != header['crc']:
+                    raise SnapshotError("Snapshot checksum mismatch")
+                
+                blocks = list(_iter_blocks(view, header['index_offset']))
+    except (OSError, ValueError, struct.error) as e:
+        raise SnapshotError(f"Cannot read snapshot: {e}") from e
+    
+    if len(blocks) != header['height'] + 1 or any(block.index != i for i, block in enumerate(blocks)):
+        raise SnapshotError("Snapshot heights are not contiguous")
+    if blocks[-1].hash != header['tip_hash']:
+        raise SnapshotError("Snapshot tip hash mismatch")
+    
+    return blocks
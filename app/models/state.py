@@ -0,0 +1,122 @@
+"""
+State Model
+Account balances maintained incrementally as blocks are appended
+"""
+
+from typing import Dict, Any, Iterable
+from .block import Block
+from .transaction import Transaction
+
+
+class BalanceIndex:
+    """In-memory index of address -> balance and transaction count"""
+    
+    def __init__(self):
+        """Initialize an empty index"""
+        self._balances: Dict[str, float] = {}
+        self._tx_counts: Dict[str, int] = {}
+    
+    def _apply_transaction(self, transaction: Transaction) -> None:
+        """Add the effect of a transaction"""
+        sender = transaction.sender
+        recipient = transaction.recipient
+        amount = transaction.amount
+        
+        # The sender also pays the fee, which is part of the miner reward
+        self._balances[sender] = self._balances.get(sender, 0.0) - (amount + transaction.fee)
+        self._balances[recipient] = self._balances.get(recipient, 0.0) + amount
+        
+        self._tx_counts[sender] = self._tx_counts.get(sender, 0) + 1
+        if recipient != sender:
+            self._tx_counts[recipient] = self._tx_counts.get(recipient, 0) + 1
+    
+    def apply_block(self, block: Block) -> None:
+        """
+        Add the transactions of an appended block
+        
+        Args:
+            block: Block appended to the chain
+        """
+        for transaction in block.transactions:
+            self._apply_transaction(transaction)
+    
+    def rebuild(self, blocks: Iterable[Block]) -> None:
+        """
+        Recompute the index from scratch
+        
+        Args:
+            blocks: Every block of the chain in order
+        """
+        self.clear()
+        for block in blocks:
+            self.apply_block(block)
+    
+    def clear(self) -> None:
+        """Forget every account"""
+        self._balances = {}
+        self._tx_counts = {}
+    
+    def get_balance(self, address: str) -> float:
+        """
+        Get the balance of an address
+        
+        Args:
+            address: Address to check
+            
+        Returns:
+            Current balance
+        """
+        return self._balances.get(address, 0.0)
+    
+    def get_transaction_count(self, address: str) -> int:
+        """
+        Get the number of mined transactions involving an address
+        
+        Args:
+            address: Address to check
+            
+        Returns:
+            Number of transactions sent or received
+        """
+        return self._tx_counts.get(address, 0)
+    
+    def get_account(self, address: str) -> Dict[str, Any]:
+        """
+        Get the indexed state of an address
+        
+        Args:
+            address: Address to check
+            
+        Returns:
+            Dictionary with balance and transaction count
+        """
+        return {
+            'address': address,
+            'balance': self.get_balance(address),
+            'transaction_count': self.get_transaction_count(address)
+        }
+    
+    def get_accounts(self, addresses: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the indexed state of many addresses at once
+        
+        Args:
+            addresses: Addresses to check
+            
+        Returns:
+            Dictionary of address -> balance and transaction count
+        """
+        balances = self._balances
+        tx_counts = self._tx_counts
+        
+        return {
+            address: {
+                'balance': balances.get(address, 0.0),
+                'transaction_count': tx_counts.get(address, 0)
+            }
+            for address in addresses
+        }
+    
+    def __len__(self) -> int:
+        """Number of known addresses"""
+        return len(self._tx_counts)
@@ -3,6 +3,9 @@ Transaction Model
 Represents a transaction in the blockchain
 """
 
+import hashlib
+import json
+import math
 import time
 from typing import Dict, Any
 from datetime import datetime
@@ -11,7 +14,14 @@ from datetime import datetime
 class Transaction:
     """Represents a transaction between two parties"""
     
-    def __init__(self, sender: str, recipient: str, amount: float, timestamp: float = None):
+    def __init__(
+        self,
+        sender: str,
+        recipient: str,
+        amount: float,
+        timestamp: float = None,
+        fee: float = 0.0
+    ):
         """
         Initialize a new transaction
         
@@ -20,11 +30,13 @@ class Transaction:
             recipient: Address of the recipient
             amount: Amount to transfer
             timestamp: Transaction timestamp (defaults to current time)
+            fee: Fee paid by the sender to the miner (higher fees are mined first)
         """
         self.sender = sender
         self.recipient = recipient
         self.amount = amount
         self.timestamp = timestamp or time.time()
+        self.fee = fee or 0.0
     
     def is_valid(self) -> bool:
         """
@@ -37,12 +49,55 @@ class Transaction:
         if not self.sender or not self.recipient:
             return False
         
+        # Check if amount and fee are finite (NaN passes every comparison below)
+        if not (math.isfinite(self.amount) and math.isfinite(self.fee)):
+            return False
+        
         # Check if amount is positive
         if self.amount <= 0:
             return False
         
+        # Check if fee is not negative
+        if self.fee < 0:
+            return False
+        
         return True
     
+    def calculate_hash(self) -> str:
+        """
+        Calculate the SHA-256 hash of the transaction
+        
+        Returns:
+            Hexadecimal hash string
+        """
+        tx_string = json.dumps(self.canonical_dict(), sort_keys=True)
+        return hashlib.sha256(tx_string.encode()).hexdigest()
+    
+    @property
+    def size(self) -> int:
+        """Size of the serialized transaction in bytes"""
+        return len(json.dumps(self.to_dict()).encode())
+    
+    def canonical_dict(self) -> Dict[str, Any]:
+        """
+        Get the fields committed to by hashes
+        
+        A zero fee is left out so transactions created before fees existed
+        keep their original hash.
+        
+        Returns:
+            Dictionary of hashed fields
+        """
+        data = {
+            'sender': self.sender,
+            'recipient': self.recipient,
+            'amount': self.amount,
+            'timestamp': self.timestamp
+        }
+        if self.fee:
+            data['fee'] = self.fee
+        return data
+    
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert transaction to dictionary
@@ -54,7 +109,8 @@ class Transaction:
             'sender': self.sender,
             'recipient': self.recipient,
             'amount': self.amount,
-            'timestamp': self.timestamp
+            'timestamp': self.timestamp,
+            'fee': self.fee
         }
     
     @classmethod
@@ -72,7 +128,8 @@ class Transaction:
             sender=data['sender'],
             recipient=data['recipient'],
             amount=data['amount'],
-            timestamp=data.get('timestamp')
+            timestamp=data.get('timestamp'),
+            fee=data.get('fee') or 0.0
         )
     
     def __repr__(self) -> str:
@@ -0,0 +1,223 @@
+"""
+Validation Model
+Chain verification engine (serial or split across a process pool)
+"""
+
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
+from .block import Block
+
+
+# Reasons reported for invalid blocks
+INVALID_TRANSACTION = 'invalid_transaction'
+MERKLE_ROOT_MISMATCH = 'merkle_root_mismatch'
+HASH_MISMATCH = 'hash_mismatch'
+PREVIOUS_HASH_MISMATCH = 'previous_hash_mismatch'
+INSUFFICIENT_WORK = 'insufficient_proof_of_work'
+
+
+def check_block(block: Block, difficulty: int) -> List[str]:
+    """
+    Verify a single block on its own (everything except the link to its parent)
+    
+    Args:
+        block: Block to verify
+        difficulty: Number of leading zeros required in hash
+        
+    Returns:
+        List of reasons the block is invalid (empty if valid)
+    """
+    reasons = []
+    
+    if not all(tx.is_valid() for tx in block.transactions):
+        reasons.append(INVALID_TRANSACTION)
+    
+    if block.merkle_root != block.calculate_merkle_root():
+        reasons.append(MERKLE_ROOT_MISMATCH)
+    
+    if block.hash != block.calculate_hash():
+        reasons.append(HASH_MISMATCH)
+    
+    if not block.hash.startswith('0' * difficulty):
+        reasons.append(INSUFFICIENT_WORK)
+    
+    return reasons
+
+
+def _validate_range(blocks: List[Block], difficulty: int) -> List[Tuple[int, str]]:
+    """
+    Verify a contiguous range of blocks and the links inside it
+    
+    The link between the first block and its parent is left to the caller.
+    
+    Args:
+        blocks: Consecutive blocks of the chain
+        difficulty: Number of leading zeros required in hash
+        
+    Returns:
+        List of (block index, reason) pairs
+    """
+    errors = []
+    previous_block = None
+    
+    for block in blocks:
+        for reason in check_block(block, difficulty):
+            errors.append((block.index, reason))
+        
+        if previous_block is not None and block.previous_hash != previous_block.hash:
+            errors.append((block.index, PREVIOUS_HASH_MISMATCH))
+        
+        previous_block = block
+    
+    return errors
+
+
+class ValidationReport:
+    """Structured result of a chain validation"""
+    
+    def __init__(
+        self,
+        start: int,
+        end: int,
+        errors: List[Tuple[int, str]],
+        elapsed: float,
+        workers: int
+    ):
+        """
+        Initialize a validation report
+        
+        Args:
+            start: First verified height
+            end: Last verified height
+            errors: (block index, reason) pairs for every problem found
+            elapsed: Wall-clock validation time in seconds
+            workers: Number of processes that took part
+        """
+        self.start = start
+        self.end = end
+        self.errors = sorted(errors)
+        self.elapsed = elapsed
+        self.workers = workers
+    
+    @property
+    def valid(self) -> bool:
+        """True if no problem was found"""
+        return not self.errors
+    
+    @property
+    def checked_blocks(self) -> int:
+        """Number of blocks verified"""
+        return max(self.end - self.start + 1, 0)
+    
+    @property
+    def invalid_heights(self) -> List[int]:
+        """Sorted heights of all invalid blocks"""
+        return sorted({index for index, _ in self.errors})
+    
+    @property
+    def first_invalid_height(self) -> Optional[int]:
+        """Lowest invalid height, None if the chain is valid"""
+        return self.errors[0][0] if self.errors else None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert report to dictionary
+        
+        Returns:
+            Dictionary representation of the report
+        """
+        return {
+            'valid': self.valid,
+            'checked_from': self.start,
+            'checked_to': self.end,
+            'checked_blocks': self.checked_blocks,
+            'invalid_heights': self.invalid_heights,
+            'errors': [{'index': index, 'reason': reason} for index, reason in self.errors],
+            'elapsed': self.elapsed,
+            'workers': self.workers
+        }
+
+
+class ChainValidator:
+    """Verifies block ranges, in parallel worker processes for long ranges"""
+    
+    def __init__(self, workers: int = 1, min_blocks_per_worker: int = 1000):
+        """
+        Initialize a chain validator
+        
+        Args:
+            workers: Number of worker processes (1 = serial, 0 = every CPU core)
+            min_blocks_per_worker: Ranges shorter than this are not worth a process
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.min_blocks_per_worker = min_blocks_per_worker
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+    
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Start the worker pool on first use"""
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+            return self._pool
+    
+    def validate(self, chain: List[Block], difficulty: int, start: int = 1) -> ValidationReport:
+        """
+        Verify chain[start:] including the link of chain[start] to its parent
+        
+        The range is split into one slice per worker. Each worker rehashes and
+        checks proof-of-work for its slice, then the previous_hash links at the
+        slice boundaries are stitched together here.
+        
+        Args:
+            chain: Full chain
+            difficulty: Number of leading zeros required in hash
+            start: First height to verify (the genesis block is not verified)
+            
+        Returns:
+            Validation report listing every invalid height
+        """
+        began = time.perf_counter()
+        start = max(start, 1)
+        end = len(chain) - 1
+        count = end - start + 1
+        
+        workers = min(self.workers, max(count // self.min_blocks_per_worker, 1))
+        bounds = [start + count * i // workers for i in range(workers + 1)]
+        
+        if workers == 1:
+            errors = _validate_range(chain[start:end + 1], difficulty) if count > 0 else []
+        else:
+            pool = self._get_pool()
+            futures = [
+                pool.submit(_validate_range, chain[bounds[i]:bounds[i + 1]], difficulty)
+                for i in range(workers)
+            ]
+            errors = [error for future in futures for error in future.result()]
+        
+        # Stitch the links at the range boundaries (including chain[start])
+        for boundary in bounds[:-1]:
+            if boundary <= end and chain[boundary].previous_hash != chain[boundary - 1].hash:
+                errors.append((boundary, PREVIOUS_HASH_MISMATCH))
+        
+        return ValidationReport(
+            start=start,
+            end=end,
+            errors=errors,
+            elapsed=time.perf_counter() - began,
+            workers=workers
+        )
+    
+    def shutdown(self) -> None:
+        """Stop the worker pool"""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(cancel_futures=True)
+                self._pool = None
@@ -3,6 +3,6 @@ Services Package
 """
 
 from .supabase_service import supabase_service
-from .blockchain_service import blockchain_service
+from .container import services, ServiceNotReady
 
-__all__ = ['supabase_service', 'blockchain_service']
+__all__ = ['supabase_service', 'services', 'ServiceNotReady']
@@ -0,0 +1,230 @@
+"""
+Async Supabase Service
+Non-blocking database reads over a pooled keep-alive HTTP client
+"""
+
+import asyncio
+import json
+from typing import List, Dict, Any, Optional
+import httpx
+from ..config.settings import settings
+
+
+class AsyncSupabaseService:
+    """
+    Async access to the Supabase REST API (PostgREST)
+    
+    All requests share one httpx.AsyncClient, so connections are pooled and
+    kept alive between requests. Independent queries are sent concurrently.
+    """
+    
+    def __init__(self):
+        """Initialize the service, the HTTP client is created on first use"""
+        self._client: Optional[httpx.AsyncClient] = None
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared HTTP client (created inside the running event loop)"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=f"{settings.SUPABASE_URL}/rest/v1",
+                headers={
+                    'apikey': settings.SUPABASE_KEY,
+                    'Authorization': f"Bearer {settings.SUPABASE_KEY}"
+                },
+                limits=httpx.Limits(
+                    max_connections=settings.DB_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.DB_MAX_CONNECTIONS
+                ),
+                timeout=settings.DB_TIMEOUT
+            )
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the pooled connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    async def _select(self, table: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Run a select query (errors are raised)
+        
+        Args:
+            table: Table name
+            params: PostgREST query parameters
+            
+        Returns:
+            Rows
+        """
+        response = await self.client.get(f"/{table}", params={'select': '*', **params})
+        response.raise_for_status()
+        return response.json()
+    
+    async def _count(self, table: str) -> int:
+        """
+        Count the rows of a table with a HEAD request (errors are raised)
+        
+        Args:
+            table: Table name
+            
+        Returns:
+            Exact row count
+        """
+        response = await self.client.head(
+            f"/{table}",
+            params={'select': '*'},
+            headers={'Prefer': 'count=exact'}
+        )
+        response.raise_for_status()
+        # Content-Range looks like "0-24/25" or "*/0"
+        return int(response.headers['content-range'].rsplit('/', 1)[1])
+    
+    @staticmethod
+    def _block_data(block: Dict[str, Any]) -> Dict[str, Any]:
+        """Parse the transactions JSON of a blocks row"""
+        block['transactions'] = json.loads(block['transactions'])
+        block['index'] = block['block_index']
+        return block
+    
+    # ==================== BLOCK OPERATIONS ====================
+    
+    async def get_block_by_index(self, index: int) -> Optional[Dict[str, Any]]:
+        """
+        Get a block by its index
+        
+        Args:
+            index: Block index
+            
+        Returns:
+            Block data or None
+        """
+        try:
+            rows = await self._select('blocks', {'block_index': f"eq.{index}"})
+            return self._block_data(rows[0]) if rows else None
+        
+        except Exception as e:
+            print(f"✗ Error getting block: {e}")
+            return None
+    
+    async def get_blocks(self, start: int, limit: int) -> List[Dict[str, Any]]:
+        """
+        Get up to `limit` blocks with block_index >= start
+        
+        Args:
+            start: First block index
+            limit: Maximum number of blocks (a server row limit may return fewer)
+            
+        Returns:
+            List of block data
+        """
+        try:
+            rows = await self._select('blocks', {
+                'block_index': f"gte.{start}",
+                'order': 'block_index',
+                'limit': limit
+            })
+            return [self._block_data(row) for row in rows]
+        
+        except Exception as e:
+            print(f"✗ Error getting blocks: {e}")
+            return []
+    
+    async def get_latest_block(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the latest block from the database
+        
+        Returns:
+            Latest block data or None
+        """
+        try:
+            rows = await self._select('blocks', {'order': 'block_index.desc', 'limit': 1})
+            return self._block_data(rows[0]) if rows else None
+        
+        except Exception as e:
+            print(f"✗ Error getting latest block: {e}")
+            return None
+    
+    # ==================== TRANSACTION OPERATIONS ====================
+    
+    async def get_transactions_by_block(self, block_index: int) -> List[Dict[str, Any]]:
+        """
+        Get all transactions in a specific block
+        
+        Args:
+            block_index: Block index
+            
+        Returns:
+            List of transaction data
+        """
+        try:
+            return await self._select('transactions', {'block_index': f"eq.{block_index}"})
+        
+        except Exception as e:
+            print(f"✗ Error getting transactions: {e}")
+            return []
+    
+    async def get_transactions_by_address(self, address: str) -> List[Dict[str, Any]]:
+        """
+        Get all transactions involving an address
+        
+        The sender and recipient queries run concurrently.
+        
+        Args:
+            address: Wallet address
+            
+        Returns:
+            List of transaction data (sent first, then received)
+        """
+        try:
+            sent, received = await asyncio.gather(
+                self._select('transactions', {'sender': f"eq.{address}"}),
+                self._select('transactions', {'recipient': f"eq.{address}"})
+            )
+            return sent + received
+        
+        except Exception as e:
+            print(f"✗ Error getting transactions: {e}")
+            return []
+    
+    async def get_all_transactions(self) -> List[Dict[str, Any]]:
+        """
+        Get all transactions from the database
+        
+        Returns:
+            List of transaction data
+        """
+        try:
+            return await self._select('transactions', {'order': 'timestamp'})
+        
+        except Exception as e:
+            print(f"✗ Error getting all transactions: {e}")
+            return []
+    
+    # ==================== UTILITY OPERATIONS ====================
+    
+    async def get_blockchain_stats(self) -> Dict[str, Any]:
+        """
+        Get blockchain statistics from database
+        
+        Both tables are counted concurrently without downloading any row.
+        
+        Returns:
+            Statistics dictionary
+        """
+        try:
+            total_blocks, total_transactions = await asyncio.gather(
+                self._count('blocks'),
+                self._count('transactions')
+            )
+            return {
+                'total_blocks': total_blocks,
+                'total_transactions': total_transactions
+            }
+        
+        except Exception as e:
+            print(f"✗ Error getting stats: {e}")
+            return {
+                'total_blocks': 0,
+                'total_transactions': 0
+            }
@@ -0,0 +1,118 @@
+"""
+Block Cache
+Serialized JSON of immutable blocks, kept in a bounded LRU
+"""
+
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict
+from ..models import Block
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(data: Any) -> bytes:
+    """
+    Encode a value as compact JSON bytes
+    
+    Uses orjson when it is installed, the standard library otherwise.
+    
+    Args:
+        data: JSON-serializable value
+        
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode()
+
+
+class BlockCache:
+    """
+    LRU cache of block JSON keyed by block hash
+    
+    Mined blocks never change, so a block is serialized at most once while
+    it stays in the cache. A hash identifies one block, which keeps entries
+    of a discarded chain from ever being served for a new one.
+    """
+    
+    def __init__(self, max_blocks: int):
+        """
+        Initialize the cache
+        
+        Args:
+            max_blocks: Maximum number of cached blocks (0 = caching disabled)
+        """
+        self.max_blocks = max_blocks
+        self._entries: 'OrderedDict[str, bytes]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def put(self, block_hash: str, block_data: Dict[str, Any]) -> bytes:
+        """
+        Serialize block data and cache it
+        
+        Args:
+            block_hash: Hash of the block
+            block_data: Block dictionary (Block.to_dict())
+            
+        Returns:
+            Block JSON
+        """
+        data = dumps(block_data)
+        if self.max_blocks <= 0:
+            return data
+        
+        with self._lock:
+            self._entries[block_hash] = data
+            self._entries.move_to_end(block_hash)
+            while len(self._entries) > self.max_blocks:
+                self._entries.popitem(last=False)
+        return data
+    
+    def get(self, block: Block) -> bytes:
+        """
+        Get the JSON of a block, serializing it on a miss
+        
+        Args:
+            block: Block
+            
+        Returns:
+            Block JSON
+        """
+        with self._lock:
+            data = self._entries.get(block.hash)
+            if data is not None:
+                self._entries.move_to_end(block.hash)
+                self.hits += 1
+                return data
+            self.misses += 1
+        
+        return self.put(block.hash, block.to_dict())
+    
+    def clear(self) -> None:
+        """Drop every cached block"""
+        with self._lock:
+            self._entries.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+        
+        Returns:
+            Dictionary with size, capacity, hits and misses
+        """
+        with self._lock:
+            return {
+                'size': len(self._entries),
+                'max_blocks': self.max_blocks,
+                'hits': self.hits,
+                'misses': self.misses,
+                'encoder': 'orjson' if orjson is not None else 'json'
+            }
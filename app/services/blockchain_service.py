@@ -3,59 +3,421 @@ Blockchain Service
 Business logic for blockchain operations
 """
 
-from typing import List, Dict, Any, Optional
-from ..models import Block, Blockchain, Transaction
-from .supabase_service import supabase_service
+import json
+import os
+import threading
+import time
+from typing import List, Dict, Any, Callable, Optional, Set, Tuple
+from ..models import Block, Blockchain, ChainValidator, MiningCancelled, Transaction, create_miner
+from ..models.snapshot import SnapshotError, read_snapshot, write_snapshot
+from .storage import StorageBackend, ThreadedAsyncStorage, create_storage, create_async_storage
+from .persistence import PersistenceQueue
+from .block_cache import BlockCache, dumps
+from .events import EventBus, EVENT_BLOCK, EVENT_TRANSACTION, EVENT_RESET
 from ..config.settings import settings
 
 
+# Messages for mempool rejection reasons
+REJECTION_MESSAGES = {
+    'malformed': 'Transaction needs sender, recipient, amount and an optional numeric fee',
+    'invalid': 'Invalid transaction',
+    'duplicate': 'Transaction is already pending',
+    'mempool_full': 'Mempool is full, retry later or pay a higher fee'
+}
+
+# Attempts to resume loading the chain after a failed database read
+LOAD_ATTEMPTS = 3
+
+# Values of CHAIN_LOAD_MODE
+CHAIN_LOAD_MODES = ('trust', 'verify')
+
+
+class InvalidChainError(Exception):
+    """Raised when the stored chain has a gap or, with CHAIN_LOAD_MODE=verify, invalid blocks"""
+    pass
+
+
 class BlockchainService:
     """Service for managing blockchain operations"""
     
-    def __init__(self):
-        """Initialize blockchain service"""
+    def __init__(
+        self,
+        storage: Optional[StorageBackend] = None,
+        async_storage=None,
+        progress: Optional[Callable[[str, int], None]] = None
+    ):
+        """
+        Initialize blockchain service and load the chain
+        
+        Args:
+            storage: Block store (defaults to the backend selected by STORAGE_BACKEND)
+            async_storage: Async read layer (defaults to the one of the configured
+                backend, or a threaded wrapper around a custom storage)
+            progress: Optional callback receiving (phase, loaded blocks) while loading
+        """
+        self.load_mode = settings.CHAIN_LOAD_MODE.lower()
+        if self.load_mode not in CHAIN_LOAD_MODES:
+            raise ValueError(f"Unknown chain load mode '{settings.CHAIN_LOAD_MODE}', use 'trust' or 'verify'")
+        
+        self._progress = progress
+        self._report_progress('connecting', 0)
+        if storage is None:
+            storage = create_storage(settings.STORAGE_BACKEND)
+            if async_storage is None:
+                async_storage = create_async_storage(settings.STORAGE_BACKEND, storage)
+        self.storage = storage
+        self.async_storage = async_storage or ThreadedAsyncStorage(storage)
+        self.miner = create_miner(settings.MINING_ENGINE, settings.MINING_WORKERS)
+        self.validator = ChainValidator(workers=settings.VALIDATION_WORKERS)
+        self.persistence = PersistenceQueue(
+            self.storage,
+            batch_size=settings.PERSISTENCE_BATCH_SIZE,
+            retry_delay=settings.PERSISTENCE_RETRY_DELAY,
+            max_retry_delay=settings.PERSISTENCE_MAX_RETRY_DELAY
+        )
+        self._snapshot_lock = threading.Lock()
+        # Height of the snapshot file on disk (None = no snapshot)
+        self._snapshot_height: Optional[int] = None
+        # Guards swapping self.blockchain against publishing a freshly mined block
+        self._reset_lock = threading.Lock()
+        # Cancel events of the mine_block() calls in progress
+        self._mining_cancels: Set[threading.Event] = set()
+        self.block_cache = BlockCache(settings.BLOCK_CACHE_SIZE)
+        self.events = EventBus(
+            max_queue=settings.EVENT_QUEUE_SIZE,
+            max_subscribers=settings.EVENT_MAX_SUBSCRIBERS
+        )
+        # Last database row counts as (monotonic time, counts), see get_stats()
+        self._db_counts: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._db_counts_refreshing = False
         self.blockchain = Blockchain(
             difficulty=settings.MINING_DIFFICULTY,
-            mining_reward=settings.MINING_REWARD
+            mining_reward=settings.MINING_REWARD,
+            miner=self.miner,
+            validator=self.validator,
+            mempool_size=settings.MEMPOOL_MAX_SIZE,
+            mempool_shards=settings.MEMPOOL_SHARDS,
+            max_block_transactions=settings.MAX_BLOCK_TRANSACTIONS,
+            max_block_bytes=settings.MAX_BLOCK_BYTES
         )
-        self._load_from_database()
+        self._snapshot_stale = False
+        try:
+            self._load_from_database()
+            self._load_validation_checkpoint()
+            self._verify_loaded_chain()
+        except Exception:
+            # Don't leave the worker pools behind when the service can't start
+            self.persistence.shutdown(0)
+            self.miner.shutdown()
+            self.validator.shutdown()
+            raise
+        
+        # Refresh the snapshot off the startup path, only once the chain is accepted
+        if self._snapshot_stale:
+            threading.Thread(target=self.save_snapshot, name='snapshot', daemon=True).start()
+    
+    def _report_progress(self, phase: str, loaded_blocks: int):
+        """Pass the load progress to the progress callback, if any"""
+        if self._progress is not None:
+            self._progress(phase, loaded_blocks)
     
     def _load_from_database(self):
-        """Load blockchain from Supabase database"""
-        try:
-            blocks = supabase_service.get_all_blocks()
+        """
+        Load blockchain from the local snapshot and the storage backend
+        
+        Blocks after the snapshot height are streamed from storage page by
+        page. Without a usable snapshot the whole chain comes from storage.
+        A failed read is resumed from the last loaded block; if it keeps
+        failing the error is raised, never replaced by a fresh chain that
+        would overwrite the stored one.
+        """
+        self._report_progress('snapshot', 0)
+        chain = self._load_snapshot()
+        snapshot_height = len(chain) - 1
+        self._snapshot_height = snapshot_height if chain else None
+        self._report_progress('database', len(chain))
+        
+        if chain:
+            print(f"Loading blocks after height {snapshot_height} from database...")
+        else:
+            print("Loading blocks from database...")
+        
+        for attempt in range(1, LOAD_ATTEMPTS + 1):
+            try:
+                self._stream_blocks(chain)
+                break
+            except InvalidChainError:
+                raise
+            except Exception as e:
+                print(f"✗ Error loading from database at height {len(chain)} (attempt {attempt}/{LOAD_ATTEMPTS}): {e}")
+                if attempt == LOAD_ATTEMPTS:
+                    raise
+                time.sleep(settings.PERSISTENCE_RETRY_DELAY * 2 ** (attempt - 1))
+        
+        if chain:
+            self.blockchain.chain = chain
             
-            if blocks:
-                print(f"Loading {len(blocks)} blocks from database...")
-                
-                # Clear current chain (including genesis block)
-                self.blockchain.chain = []
-                
-                # Load each block
-                for block_data in blocks:
-                    block = Block.from_dict(block_data)
-                    self.blockchain.chain.append(block)
-                
-                print(f"✓ Loaded {len(blocks)} blocks from Supabase")
-            else:
-                print("No blocks in database, using genesis block")
-                # Save genesis block to database
-                genesis = self.blockchain.get_latest_block()
-                if genesis:
-                    supabase_service.save_block(genesis.to_dict())
-                    
+            # Index balances once for the loaded chain
+            self._report_progress('indexing', len(chain))
+            self.blockchain.rebuild_state()
+            
+            print(f"✓ Loaded {len(chain) - snapshot_height - 1} block(s) from database ({len(chain)} total)")
+            self._reconcile_persistence(len(chain) - 1)
+            self._snapshot_stale = len(chain) - 1 > snapshot_height
+        else:
+            print("No blocks in database, using genesis block")
+            # Queue the genesis block for saving
+            self._reconcile_persistence(None)
+    
+    def _stream_blocks(self, chain: List[Block]):
+        """
+        Append the stored blocks following the chain (errors are raised)
+        
+        A gap in the stored heights raises InvalidChainError: dropping the
+        blocks after it would have new blocks mined at heights that are
+        already taken in storage.
+        
+        Args:
+            chain: Blocks loaded so far, extended in place
+        """
+        for block_data in self.storage.iter_blocks(start=len(chain)):
+            if block_data['index'] != len(chain):
+                raise InvalidChainError(
+                    f"Block {len(chain)} missing in database (next stored block is {block_data['index']})"
+                )
+            chain.append(Block.from_dict(block_data))
+            if len(chain) % 1000 == 0:
+                self._report_progress('database', len(chain))
+    
+    def _load_snapshot(self) -> List[Block]:
+        """
+        Load the local snapshot if it still matches the database
+        
+        Returns:
+            Snapshot blocks, empty if there is no usable snapshot
+        """
+        path = settings.SNAPSHOT_FILE
+        if not path or not os.path.exists(path):
+            return []
+        
+        try:
+            blocks = read_snapshot(path)
+        except SnapshotError as e:
+            print(f"✗ Ignoring snapshot: {e}")
+            return []
+        
+        # The database may have been reset or rewritten since the snapshot
+        stored = self.storage.get_block_by_index(blocks[-1].index)
+        if stored is None or stored['hash'] != blocks[-1].hash:
+            print("✗ Snapshot doesn't match the database, loading the full chain")
+            return []
+        
+        print(f"✓ Loaded {len(blocks)} blocks from snapshot")
+        return blocks
+    
+    def save_snapshot(self) -> bool:
+        """
+        Write the persisted part of the chain to the local snapshot file
+        
+        Nothing is written when the snapshot is already at that height.
+        
+        Returns:
+            True if a snapshot was written
+        """
+        path = settings.SNAPSHOT_FILE
+        height = self.persistence.last_persisted_height
+        if not path or height is None:
+            return False
+        
+        with self._snapshot_lock:
+            if height == self._snapshot_height:
+                return False
+            try:
+                blocks = self.blockchain.chain[:height + 1]
+                write_snapshot(path, blocks)
+                self._snapshot_height = blocks[-1].index
+                print(f"✓ Snapshot saved at height {blocks[-1].index}")
+                return True
+            except Exception as e:
+                print(f"✗ Error saving snapshot: {e}")
+                return False
+    
+    def _reconcile_persistence(self, persisted_height: Optional[int]):
+        """
+        Queue every in-memory block above the last persisted height
+        
+        Args:
+            persisted_height: Height of the last block in the database (None if empty)
+        """
+        self.persistence.last_persisted_height = persisted_height
+        first = 0 if persisted_height is None else persisted_height + 1
+        
+        missing = self.blockchain.chain[first:]
+        for block in missing:
+            self.persistence.enqueue(block.to_dict())
+        
+        if missing:
+            print(f"Queued {len(missing)} block(s) not yet in the database")
+    
+    def _load_validation_checkpoint(self):
+        """Restore the validation checkpoint saved by a previous run"""
+        path = settings.VALIDATION_CHECKPOINT_FILE
+        if not path or not os.path.exists(path):
+            return
+        
+        try:
+            with open(path) as f:
+                checkpoint = json.load(f)
+            self.blockchain.set_validation_checkpoint(checkpoint['height'], checkpoint['hash'])
+        except Exception as e:
+            print(f"✗ Error loading validation checkpoint: {e}")
+    
+    def _save_validation_checkpoint(self):
+        """Persist the validation checkpoint"""
+        path = settings.VALIDATION_CHECKPOINT_FILE
+        if not path:
+            return
+        
+        try:
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(self.blockchain.get_validation_checkpoint(), f)
+            os.replace(tmp_path, path)
         except Exception as e:
-            print(f"✗ Error loading from database: {e}")
-            print("Using fresh blockchain with genesis block")
+            print(f"✗ Error saving validation checkpoint: {e}")
+    
+    def _verify_loaded_chain(self):
+        """
+        Verify the loaded chain according to CHAIN_LOAD_MODE
+        
+        "verify" re-checks every block before the service is used and fails
+        the load if any block is invalid. "trust" keeps the stored hashes as
+        loaded and, with BACKGROUND_VALIDATION, checks the blocks past the
+        validation checkpoint on a background thread.
+        """
+        if self.load_mode == 'verify':
+            self._report_progress('validating', len(self.blockchain.chain))
+            result = self.validate_chain(full=True)
+            self._report_validation(result)
+            if not result['valid']:
+                raise InvalidChainError(
+                    f"Invalid blocks in the loaded chain at heights {result['report']['invalid_heights']}"
+                )
+        elif settings.BACKGROUND_VALIDATION:
+            thread = threading.Thread(
+                target=lambda: self._report_validation(self.validate_chain()),
+                name='chain-validation',
+                daemon=True
+            )
+            thread.start()
+    
+    @staticmethod
+    def _report_validation(result: Dict[str, Any]):
+        """Print the outcome of a load-time validation"""
+        report = result['report']
+        if result['valid']:
+            print(f"✓ Verified {report['checked_blocks']} block(s) in {report['elapsed']:.2f}s")
+        else:
+            print(f"✗ Invalid blocks in the loaded chain at heights {report['invalid_heights']}")
+    
+    def _delete_snapshot(self):
+        """Remove the local snapshot file"""
+        path = settings.SNAPSHOT_FILE
+        with self._snapshot_lock:
+            if path and os.path.exists(path):
+                os.remove(path)
+            self._snapshot_height = None
     
-    def get_chain(self) -> List[Dict[str, Any]]:
+    def get_blocks(
+        self,
+        start: int = 0,
+        end: Optional[int] = None,
+        limit: Optional[int] = None,
+        headers_only: bool = False
+    ) -> Dict[str, Any]:
         """
-        Get the entire blockchain
+        Get one page of consecutive blocks
         
+        Only the blocks of the page are serialized, so the cost depends on
+        the page size and not on the chain length. Blocks are never removed
+        or changed once appended, so a height is a stable cursor.
+        
+        Args:
+            start: First block index
+            end: Last block index, inclusive (None = chain tip)
+            limit: Maximum number of blocks (default BLOCKS_PAGE_SIZE, capped at BLOCKS_MAX_PAGE_SIZE)
+            headers_only: Return block headers with a transaction count instead of full blocks
+            
         Returns:
-            List of block dictionaries
+            Dictionary with the blocks, the chain length and the next cursor
+            (the index to pass as start for the next page, None after the last one)
         """
-        return [block.to_dict() for block in self.blockchain.chain]
+        page, length, next_cursor = self._block_page(start, end, limit)
+        
+        if headers_only:
+            blocks = [block.to_header_dict() for block in page]
+        else:
+            blocks = [block.to_dict() for block in page]
+        
+        return {
+            'blocks': blocks,
+            'length': length,
+            'next_cursor': next_cursor
+        }
+    
+    def get_blocks_json(
+        self,
+        start: int = 0,
+        end: Optional[int] = None,
+        limit: Optional[int] = None,
+        list_key: str = 'blocks'
+    ) -> bytes:
+        """
+        Get one page of full blocks as a JSON document
+        
+        Same page as get_blocks(), assembled from the cached JSON of each
+        block instead of serializing the blocks again.
+        
+        Args:
+            start: First block index
+            end: Last block index, inclusive (None = chain tip)
+            limit: Maximum number of blocks
+            list_key: Key of the block list in the document
+            
+        Returns:
+            JSON with the blocks, the chain length and the next cursor
+        """
+        page, length, next_cursor = self._block_page(start, end, limit)
+        blocks = b','.join(self.block_cache.get(block) for block in page)
+        return b''.join([
+            b'{', dumps(list_key), b':[', blocks, b'],',
+            b'"length":', dumps(length), b',',
+            b'"next_cursor":', dumps(next_cursor), b'}'
+        ])
+    
+    def _block_page(self, start: int, end: Optional[int], limit: Optional[int]) -> Tuple[List[Block], int, Optional[int]]:
+        """
+        Select the blocks of a page
+        
+        Args:
+            start: First block index
+            end: Last block index, inclusive (None = chain tip)
+            limit: Maximum number of blocks (default BLOCKS_PAGE_SIZE, capped at BLOCKS_MAX_PAGE_SIZE)
+            
+        Returns:
+            Tuple of (blocks, chain length, next cursor)
+        """
+        limit = min(max(limit or settings.BLOCKS_PAGE_SIZE, 1), settings.BLOCKS_MAX_PAGE_SIZE)
+        
+        # Work on one chain list even if the chain is reset meanwhile
+        chain = self.blockchain.chain
+        length = len(chain)
+        stop = length if end is None else min(end + 1, length)
+        start = max(start, 0)
+        page = chain[start:min(start + limit, stop)] if start < stop else []
+        
+        next_start = start + len(page)
+        return page, length, next_start if page and next_start < stop else None
     
     def get_block(self, index: int) -> Optional[Dict[str, Any]]:
         """
@@ -70,7 +432,74 @@ class BlockchainService:
         block = self.blockchain.get_block_by_index(index)
         return block.to_dict() if block else None
     
-    def add_transaction(self, sender: str, recipient: str, amount: float) -> Dict[str, Any]:
+    def export_blocks(self, start: int = 0) -> Dict[str, Any]:
+        """
+        Export blocks from a height up to the current tip
+        
+        The tip is fixed when the export starts; blocks are converted one
+        at a time as the records are consumed.
+        
+        Args:
+            start: First block index (resume point)
+            
+        Returns:
+            Dictionary with the last exported height and the block records
+        """
+        chain, stop = self._export_range()
+        records = (chain[i].to_dict() for i in range(max(start, 0), stop))
+        return {
+            'height': stop - 1,
+            'records': records
+        }
+    
+    def export_transactions(self, start: int = 0) -> Dict[str, Any]:
+        """
+        Export the transactions of the blocks from a height up to the current tip
+        
+        Args:
+            start: First block index (resume point)
+            
+        Returns:
+            Dictionary with the last exported height and the transaction
+            records (transaction fields plus block_index)
+        """
+        chain, stop = self._export_range()
+        records = (
+            {'block_index': i, **tx.to_dict()}
+            for i in range(max(start, 0), stop)
+            for tx in chain[i].transactions
+        )
+        return {
+            'height': stop - 1,
+            'records': records
+        }
+    
+    def _export_range(self) -> Tuple[List[Block], int]:
+        """Get the chain list and its length at the start of an export"""
+        # Blocks are only appended and a reset swaps the list, so this view stays consistent
+        chain = self.blockchain.chain
+        return chain, len(chain)
+    
+    def get_block_json(self, index: int) -> Optional[bytes]:
+        """
+        Get a specific block as JSON, from the block cache
+        
+        Args:
+            index: Block index
+            
+        Returns:
+            Block JSON or None
+        """
+        block = self.blockchain.get_block_by_index(index)
+        return self.block_cache.get(block) if block else None
+    
+    def add_transaction(
+        self,
+        sender: str,
+        recipient: str,
+        amount: float,
+        fee: float = 0.0
+    ) -> Dict[str, Any]:
         """
         Add a new transaction to pending transactions
         
@@ -78,13 +507,16 @@ class BlockchainService:
             sender: Sender address
             recipient: Recipient address
             amount: Amount to transfer
+            fee: Fee paid to the miner (higher fees are mined first)
             
         Returns:
             Result dictionary
         """
-        transaction = Transaction(sender, recipient, amount)
+        transaction = Transaction(sender, recipient, amount, fee=fee)
+        reason = self.blockchain.submit_transaction(transaction)
         
-        if self.blockchain.add_transaction(transaction):
+        if reason is None:
+            self._publish_transaction(transaction)
             return {
                 'success': True,
                 'message': 'Transaction added to pending transactions',
@@ -94,39 +526,159 @@ class BlockchainService:
         else:
             return {
                 'success': False,
-                'message': 'Invalid transaction',
+                'message': REJECTION_MESSAGES.get(reason, 'Invalid transaction'),
                 'transaction': None
             }
     
-    def mine_block(self, miner_address: str) -> Dict[str, Any]:
+    def _publish_transaction(self, transaction: Transaction):
+        """Notify subscribers of a transaction accepted into the mempool"""
+        self.events.publish(
+            EVENT_TRANSACTION,
+            transaction.to_dict(),
+            (transaction.sender, transaction.recipient)
+        )
+    
+    @staticmethod
+    def _parse_transaction(item: Any) -> Optional[Transaction]:
+        """
+        Build a transaction from an untrusted batch item
+        
+        Args:
+            item: Decoded JSON value
+            
+        Returns:
+            Transaction or None if the item is malformed
+        """
+        if not isinstance(item, dict):
+            return None
+        
+        sender = item.get('sender')
+        recipient = item.get('recipient')
+        amount = item.get('amount')
+        fee = item.get('fee', 0.0)
+        
+        if not isinstance(sender, str) or not isinstance(recipient, str):
+            return None
+        
+        for number in (amount, fee):
+            if isinstance(number, bool) or not isinstance(number, (int, float)):
+                return None
+        
+        try:
+            amount, fee = float(amount), float(fee)
+        except OverflowError:
+            return None
+        
+        return Transaction(sender, recipient, amount, fee=fee)
+    
+    def add_transactions(self, items: List[Any]) -> Dict[str, Any]:
+        """
+        Add a batch of transactions to pending transactions
+        
+        Every item is checked and submitted independently, one bad item
+        doesn't reject the rest of the batch.
+        
+        Args:
+            items: Decoded JSON objects with sender, recipient, amount and fee
+            
+        Returns:
+            Result dictionary with one result per item
+        """
+        transactions = [self._parse_transaction(item) for item in items]
+        reasons = self.blockchain.submit_transactions([tx for tx in transactions if tx is not None])
+        reasons = iter(reasons)
+        
+        results = []
+        accepted = 0
+        
+        for index, transaction in enumerate(transactions):
+            reason = 'malformed' if transaction is None else next(reasons)
+            
+            if reason is None:
+                accepted += 1
+                results.append({'index': index, 'accepted': True})
+                self._publish_transaction(transaction)
+            else:
+                results.append({
+                    'index': index,
+                    'accepted': False,
+                    'reason': reason,
+                    'message': REJECTION_MESSAGES.get(reason, 'Invalid transaction')
+                })
+        
+        return {
+            'accepted': accepted,
+            'rejected': len(results) - accepted,
+            'pending_count': len(self.blockchain.pending_transactions),
+            'results': results
+        }
+    
+    def mine_block(self, miner_address: str, cancel_event=None) -> Dict[str, Any]:
         """
         Mine pending transactions into a new block
         
         Args:
             miner_address: Address to receive mining reward
+            cancel_event: Optional threading.Event that aborts mining when set
             
         Returns:
             Result dictionary with mined block
         """
-        if not self.blockchain.pending_transactions:
+        blockchain = self.blockchain
+        if not blockchain.pending_transactions:
             return {
                 'success': False,
                 'message': 'No pending transactions to mine',
                 'block': None
             }
         
+        # reset_blockchain() cancels the mining in progress through this event
+        cancel_event = cancel_event or threading.Event()
+        with self._reset_lock:
+            self._mining_cancels.add(cancel_event)
+        
         try:
             # Mine the block
-            new_block = self.blockchain.mine_pending_transactions(miner_address)
+            new_block = blockchain.mine_pending_transactions(miner_address, cancel_event)
+            block_data = new_block.to_dict()
             
-            # Save to database
-            supabase_service.save_block(new_block.to_dict())
+            with self._reset_lock:
+                # A block of a chain replaced by a reset must not reach the new one
+                if blockchain is not self.blockchain:
+                    return {
+                        'success': False,
+                        'message': 'Blockchain was reset while mining',
+                        'block': None,
+                        'cancelled': True
+                    }
+                
+                mining = blockchain.last_mining_result.to_dict()
+                
+                # Save to database in the background
+                self.persistence.enqueue(block_data)
+                # Serialize the new block once for the read endpoints
+                self.block_cache.put(new_block.hash, block_data)
+                self.events.publish(
+                    EVENT_BLOCK,
+                    block_data,
+                    {address for tx in new_block.transactions for address in (tx.sender, tx.recipient)}
+                )
             
             return {
                 'success': True,
                 'message': f'Block {new_block.index} mined successfully',
-                'block': new_block.to_dict(),
-                'reward': settings.MINING_REWARD
+                'block': block_data,
+                # The reward transaction comes last: block reward plus the fees
+                'reward': new_block.transactions[-1].amount,
+                'mining': mining
+            }
+            
+        except MiningCancelled:
+            return {
+                'success': False,
+                'message': 'Mining cancelled',
+                'block': None,
+                'cancelled': True
             }
             
         except Exception as e:
@@ -135,56 +687,156 @@ class BlockchainService:
                 'message': f'Error mining block: {str(e)}',
                 'block': None
             }
+        
+        finally:
+            with self._reset_lock:
+                self._mining_cancels.discard(cancel_event)
     
-    def validate_chain(self) -> Dict[str, Any]:
+    def validate_chain(self, full: bool = False) -> Dict[str, Any]:
         """
-        Validate the entire blockchain
+        Validate the blockchain
         
+        Args:
+            full: Re-verify every block instead of only those past the checkpoint
+            
         Returns:
             Validation result dictionary
         """
-        is_valid = self.blockchain.is_chain_valid()
+        report = self.blockchain.validate_chain(full=full)
+        self._save_validation_checkpoint()
         
         return {
-            'valid': is_valid,
-            'message': 'Blockchain is valid' if is_valid else 'Blockchain is invalid',
-            'total_blocks': len(self.blockchain.chain)
+            'valid': report.valid,
+            'message': 'Blockchain is valid' if report.valid else 'Blockchain is invalid',
+            'total_blocks': len(self.blockchain.chain),
+            'validated_height': self.blockchain.validated_height,
+            'report': report.to_dict()
         }
     
-    def get_balance(self, address: str) -> Dict[str, Any]:
+    def get_balance(self, address: str, include_transactions: bool = False) -> Dict[str, Any]:
         """
         Get balance for an address
         
+        Balance and transaction count come from the in-memory balance index,
+        the database is only queried when the transaction history is requested.
+        
+        Args:
+            address: Wallet address
+            include_transactions: Also fetch the address transaction history
+            
+        Returns:
+            Balance information
+        """
+        result = self.blockchain.state.get_account(address)
+        
+        if include_transactions:
+            result['transactions'] = self.storage.get_transactions_by_address(address)
+        
+        return result
+    
+    async def get_balance_async(self, address: str, include_transactions: bool = False) -> Dict[str, Any]:
+        """
+        Get balance for an address without blocking the event loop
+        
         Args:
             address: Wallet address
+            include_transactions: Also fetch the address transaction history
             
         Returns:
             Balance information
         """
-        balance = self.blockchain.get_balance(address)
-        transactions = supabase_service.get_transactions_by_address(address)
+        result = self.blockchain.state.get_account(address)
+        
+        if include_transactions:
+            result['transactions'] = await self.async_storage.get_transactions_by_address(address)
         
+        return result
+    
+    def get_balances(self, addresses: List[str]) -> Dict[str, Any]:
+        """
+        Get balances for many addresses
+        
+        Args:
+            addresses: Wallet addresses
+            
+        Returns:
+            Balances keyed by address
+        """
         return {
-            'address': address,
-            'balance': balance,
-            'transaction_count': len(transactions)
+            'balances': self.blockchain.get_balances(addresses)
         }
     
-    def get_stats(self) -> Dict[str, Any]:
+    def _build_stats(self) -> Dict[str, Any]:
         """
-        Get blockchain statistics
+        Assemble statistics from in-memory counters
         
         Returns:
             Statistics dictionary
         """
         stats = self.blockchain.get_stats()
-        db_stats = supabase_service.get_blockchain_stats()
+        persistence = self.persistence.get_stats()
         
-        return {
+        result = {
             **stats,
-            'database_blocks': db_stats['total_blocks'],
-            'database_transactions': db_stats['total_transactions']
+            # Everything appended minus what is still waiting to be saved
+            'database_blocks': max(stats['total_blocks'] - persistence['queue_depth'], 0),
+            'database_transactions': max(stats['total_transactions'] - persistence['queued_transactions'], 0),
+            'persistence': persistence,
+            'block_cache': self.block_cache.get_stats(),
+            'event_subscribers': self.events.subscriber_count
         }
+        
+        if self._db_counts is not None:
+            checked_at, counts = self._db_counts
+            result['database_counts'] = {
+                **counts,
+                'age': round(time.monotonic() - checked_at, 3)
+            }
+        
+        return result
+    
+    def _db_counts_expired(self) -> bool:
+        """Check whether the database row counts should be refreshed"""
+        ttl = settings.STATS_DB_COUNT_TTL
+        if ttl <= 0 or self._db_counts_refreshing:
+            return False
+        return self._db_counts is None or time.monotonic() - self._db_counts[0] >= ttl
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get blockchain statistics
+        
+        Totals come from counters kept up to date on block append. The real
+        database row counts are added under 'database_counts' for
+        reconciliation, refreshed at most every STATS_DB_COUNT_TTL seconds.
+        
+        Returns:
+            Statistics dictionary
+        """
+        if self._db_counts_expired():
+            self._db_counts = (time.monotonic(), self.storage.get_blockchain_stats())
+        
+        return self._build_stats()
+    
+    async def get_stats_async(self) -> Dict[str, Any]:
+        """
+        Get blockchain statistics without blocking the event loop
+        
+        Same as get_stats(); while one request refreshes the database counts,
+        concurrent requests keep using the previous ones.
+        
+        Returns:
+            Statistics dictionary
+        """
+        if self._db_counts_expired():
+            self._db_counts_refreshing = True
+            try:
+                counts = await self.async_storage.get_blockchain_stats()
+                self._db_counts = (time.monotonic(), counts)
+            finally:
+                self._db_counts_refreshing = False
+        
+        return self._build_stats()
     
     def get_pending_transactions(self) -> List[Dict[str, Any]]:
         """
@@ -199,22 +851,49 @@ class BlockchainService:
         """
         Reset blockchain to genesis block (use with caution!)
         
+        Mining in progress is cancelled and the reset waits for it under the
+        chain lock; a block finished on the old chain is dropped.
+        
         Returns:
             Result dictionary
         """
+        with self._reset_lock:
+            for cancel_event in self._mining_cancels:
+                cancel_event.set()
+        
+        old_blockchain = self.blockchain
+        with old_blockchain._chain_lock, self._reset_lock:
+            return self._reset_locked()
+    
+    def _reset_locked(self) -> Dict[str, Any]:
+        """Replace the chain with a new genesis block (chain and reset locks held)"""
         try:
-            # Delete from database
-            supabase_service.delete_all_blocks()
+            # Drop unsaved blocks so nothing old is written after the delete
+            self.persistence.clear()
+            
+            # Delete from database and the local snapshot
+            self.storage.delete_all_blocks()
+            self._delete_snapshot()
+            self._db_counts = None
+            self.block_cache.clear()
             
             # Create new blockchain
             self.blockchain = Blockchain(
                 difficulty=settings.MINING_DIFFICULTY,
-                mining_reward=settings.MINING_REWARD
+                mining_reward=settings.MINING_REWARD,
+                miner=self.miner,
+                validator=self.validator,
+                mempool_size=settings.MEMPOOL_MAX_SIZE,
+                mempool_shards=settings.MEMPOOL_SHARDS,
+                max_block_transactions=settings.MAX_BLOCK_TRANSACTIONS,
+                max_block_bytes=settings.MAX_BLOCK_BYTES
             )
             
             # Save genesis block
             genesis = self.blockchain.get_latest_block()
-            supabase_service.save_block(genesis.to_dict())
+            self.persistence.enqueue(genesis.to_dict())
+            self._save_validation_checkpoint()
+            self.events.publish(EVENT_RESET, {'block': genesis.to_dict()})
             
             return {
                 'success': True,
@@ -226,7 +905,13 @@ class BlockchainService:
                 'success': False,
                 'message': f'Error resetting blockchain: {str(e)}'
             }
-
-
-# Create global instance
-blockchain_service = BlockchainService()
+    
+    def shutdown(self):
+        """End event subscriptions, save queued blocks and the snapshot, then stop the worker pools"""
+        self.events.close()
+        unsaved = self.persistence.shutdown(settings.PERSISTENCE_FLUSH_TIMEOUT)
+        if unsaved:
+            print(f"✗ {unsaved} block(s) not saved to the database")
+        self.save_snapshot()
+        self.miner.shutdown()
+        self.validator.shutdown()
@@ -0,0 +1,156 @@
+"""
+Service Container
+Builds the heavy services lazily, off the import path and off the event loop
+"""
+
+import asyncio
+import threading
+import time
+from typing import Dict, Any, Optional
+from .blockchain_service import BlockchainService
+from .mining_jobs import MiningJobManager
+from ..config.settings import settings
+
+
+# Container states
+STATUS_IDLE = 'idle'
+STATUS_LOADING = 'loading'
+STATUS_READY = 'ready'
+STATUS_FAILED = 'failed'
+
+
+class ServiceNotReady(Exception):
+    """Raised when a service is requested while the chain is still loading"""
+    pass
+
+
+class ServiceContainer:
+    """
+    Holds the blockchain service and the mining job manager
+    
+    Nothing is built at import time. The app lifespan calls start(), which
+    loads the chain on a background thread while the server already accepts
+    requests; until then, requesting a service raises ServiceNotReady. Code
+    running outside the app (scripts, tests) builds the services on first
+    access instead.
+    """
+    
+    def __init__(self):
+        """Initialize an empty container"""
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._blockchain_service: Optional[BlockchainService] = None
+        self._mining_job_manager: Optional[MiningJobManager] = None
+        
+        self.status = STATUS_IDLE
+        self.phase: Optional[str] = None
+        self.loaded_blocks = 0
+        self.error: Optional[str] = None
+        self.started_at: Optional[float] = None
+        self.ready_at: Optional[float] = None
+    
+    def start(self) -> None:
+        """Start building the services on a background thread (only the first call does)"""
+        with self._lock:
+            if self.status != STATUS_IDLE:
+                return
+            self.status = STATUS_LOADING
+            self.started_at = time.time()
+            self._thread = threading.Thread(target=self._build, name='service-loader', daemon=True)
+            self._thread.start()
+    
+    def _build(self) -> None:
+        """Create the services (background thread)"""
+        try:
+            service = BlockchainService(progress=self._on_progress)
+            manager = MiningJobManager(
+                service,
+                max_jobs=settings.MINING_MAX_JOBS,
+                history=settings.MINING_JOB_HISTORY
+            )
+        except Exception as e:
+            self.error = str(e)
+            self.status = STATUS_FAILED
+            print(f"✗ Error loading blockchain: {e}")
+            return
+        
+        with self._lock:
+            self._blockchain_service = service
+            self._mining_job_manager = manager
+            self.ready_at = time.time()
+            self.loaded_blocks = len(service.blockchain.chain)
+            self.phase = STATUS_READY
+            self.status = STATUS_READY
+        
+        print(f"✓ Blockchain loaded and ready ({self.ready_at - self.started_at:.2f}s)")
+    
+    def _on_progress(self, phase: str, loaded_blocks: int) -> None:
+        """Record load progress reported by the blockchain service"""
+        self.phase = phase
+        self.loaded_blocks = loaded_blocks
+    
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Build the services if needed and wait until they are ready
+        
+        Args:
+            timeout: Maximum wait in seconds (None = no limit)
+            
+        Returns:
+            True if the services are ready
+        """
+        self.start()
+        self._thread.join(timeout)
+        return self.status == STATUS_READY
+    
+    def _require(self) -> None:
+        """Make sure the services are ready, building them on first use outside the app"""
+        if self.status == STATUS_IDLE:
+            self.wait()
+        
+        if self.status != STATUS_READY:
+            raise ServiceNotReady(self.error or 'Blockchain is still loading')
+    
+    @property
+    def blockchain_service(self) -> BlockchainService:
+        """Blockchain service (raises ServiceNotReady while loading)"""
+        self._require()
+        return self._blockchain_service
+    
+    @property
+    def mining_job_manager(self) -> MiningJobManager:
+        """Mining job manager (raises ServiceNotReady while loading)"""
+        self._require()
+        return self._mining_job_manager
+    
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get the load status
+        
+        Returns:
+            Dictionary with status, phase, loaded blocks and timings
+        """
+        now = self.ready_at or time.time()
+        return {
+            'ready': self.status == STATUS_READY,
+            'status': self.status,
+            'phase': self.phase,
+            'loaded_blocks': self.loaded_blocks,
+            'elapsed': round(now - self.started_at, 3) if self.started_at else None,
+            'error': self.error
+        }
+    
+    async def shutdown(self) -> None:
+        """Stop the background work and release connections"""
+        if self._mining_job_manager is not None:
+            self._mining_job_manager.shutdown()
+        
+        service = self._blockchain_service
+        if service is not None:
+            # Flushing the persistence queue may block for a while
+            await asyncio.to_thread(service.shutdown)
+            await service.async_storage.aclose()
+
+
+# Create global instance
+services = ServiceContainer()
@@ -0,0 +1,218 @@
+"""
+Event Bus
+Pushes new blocks and mempool changes to WebSocket and SSE subscribers
+"""
+
+import asyncio
+import itertools
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional, Set
+
+
+# Event types
+EVENT_BLOCK = 'block'
+EVENT_TRANSACTION = 'transaction'
+EVENT_RESET = 'reset'
+EVENT_LAGGED = 'lagged'
+
+EVENT_TYPES = (EVENT_BLOCK, EVENT_TRANSACTION, EVENT_RESET)
+
+
+class Subscription:
+    """
+    One subscriber of the event bus
+    
+    Events are delivered to a bounded queue owned by the subscriber's event
+    loop. When the consumer falls behind and the queue is full, new events
+    are dropped and counted; once there is room again the consumer first
+    receives a "lagged" event with the number of dropped events, so it knows
+    to resync through the REST API.
+    """
+    
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        max_queue: int,
+        types: Optional[Set[str]] = None,
+        address: Optional[str] = None
+    ):
+        """
+        Initialize a subscription
+        
+        Args:
+            loop: Event loop of the consumer
+            max_queue: Maximum number of undelivered events
+            types: Event types to receive (None = all)
+            address: Only receive events involving this address (None = all)
+        """
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max(max_queue, 2))
+        self.types = types
+        self.address = address
+        self.dropped = 0
+        self.closed = False
+    
+    def matches(self, event: Dict[str, Any], addresses: Set[str]) -> bool:
+        """
+        Check the subscription filters
+        
+        Args:
+            event: Event dictionary
+            addresses: Addresses involved in the event
+            
+        Returns:
+            True if the subscriber wants the event
+        """
+        if self.types is not None and event['type'] not in self.types:
+            return False
+        # Reset events concern every address
+        if self.address is not None and event['type'] != EVENT_RESET:
+            return self.address in addresses
+        return True
+    
+    def _deliver(self, event: Optional[Dict[str, Any]]) -> None:
+        """Put an event in the queue (runs in the consumer's event loop)"""
+        if self.closed:
+            return
+        
+        if event is None:
+            # Closing: make room for the end marker
+            self.closed = True
+            while self.queue.full():
+                self.queue.get_nowait()
+            self.queue.put_nowait(None)
+            return
+        
+        if self.dropped:
+            # A lagged notice and the event need two free slots
+            if self.queue.maxsize - self.queue.qsize() < 2:
+                self.dropped += 1
+                return
+            self.queue.put_nowait({
+                'id': event['id'],
+                'type': EVENT_LAGGED,
+                'timestamp': time.time(),
+                'data': {'dropped': self.dropped}
+            })
+            self.dropped = 0
+        elif self.queue.full():
+            self.dropped += 1
+            return
+        
+        self.queue.put_nowait(event)
+    
+    def push(self, event: Optional[Dict[str, Any]]) -> None:
+        """
+        Hand an event to the subscriber from any thread
+        
+        Args:
+            event: Event dictionary, or None to end the subscription
+        """
+        try:
+            self.loop.call_soon_threadsafe(self._deliver, event)
+        except RuntimeError:
+            # The consumer's loop is closed
+            self.closed = True
+    
+    async def get(self) -> Optional[Dict[str, Any]]:
+        """
+        Wait for the next event
+        
+        Returns:
+            Event dictionary, or None once the subscription is closed
+        """
+        return await self.queue.get()
+
+
+class EventBus:
+    """
+    In-process publish/subscribe for chain events
+    
+    Publishers (mining workers, request handlers) call publish() from any
+    thread. Filters are applied once per event on the publishing side, and
+    publishing is a no-op while nobody is subscribed.
+    """
+    
+    def __init__(self, max_queue: int = 1000, max_subscribers: int = 1000):
+        """
+        Initialize the event bus
+        
+        Args:
+            max_queue: Maximum undelivered events per subscriber
+            max_subscribers: Maximum number of concurrent subscribers
+        """
+        self.max_queue = max_queue
+        self.max_subscribers = max_subscribers
+        self._subscribers: Set[Subscription] = set()
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+    
+    def subscribe(self, types: Optional[Set[str]] = None, address: Optional[str] = None) -> Optional[Subscription]:
+        """
+        Register a subscriber on the running event loop
+        
+        Args:
+            types: Event types to receive (None = all)
+            address: Only receive events involving this address (None = all)
+            
+        Returns:
+            Subscription, or None if the subscriber limit is reached
+        """
+        subscription = Subscription(asyncio.get_running_loop(), self.max_queue, types, address)
+        with self._lock:
+            if len(self._subscribers) >= self.max_subscribers:
+                return None
+            self._subscribers.add(subscription)
+        return subscription
+    
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """
+        Remove a subscriber
+        
+        Args:
+            subscription: Subscription returned by subscribe()
+        """
+        with self._lock:
+            self._subscribers.discard(subscription)
+    
+    @property
+    def subscriber_count(self) -> int:
+        """Number of active subscribers"""
+        return len(self._subscribers)
+    
+    def publish(self, event_type: str, data: Dict[str, Any], addresses: Iterable[str] = ()) -> None:
+        """
+        Publish an event to every matching subscriber
+        
+        Args:
+            event_type: One of EVENT_TYPES
+            data: Event payload
+            addresses: Addresses involved, used by address filters
+        """
+        if not self._subscribers:
+            return
+        
+        with self._lock:
+            subscribers = list(self._subscribers)
+        
+        event = {
+            'id': next(self._ids),
+            'type': event_type,
+            'timestamp': time.time(),
+            'data': data
+        }
+        addresses = set(addresses)
+        
+        for subscription in subscribers:
+            if subscription.matches(event, addresses):
+                subscription.push(event)
+    
+    def close(self) -> None:
+        """End every subscription (on shutdown)"""
+        with self._lock:
+            subscribers = list(self._subscribers)
+            self._subscribers.clear()
+        
+        for subscription in subscribers:
+            subscription.push(None)
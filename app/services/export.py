@@ -0,0 +1,62 @@
+"""
+Chain Export
+NDJSON encoding of exported records, streamed in chunks
+"""
+
+import zlib
+from typing import Any, Iterable, Iterator
+from .block_cache import dumps
+
+
+# Bytes collected before a chunk is handed to the response
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+
+def iter_ndjson(records: Iterable[Any], chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Encode records as NDJSON, one line per record
+    
+    Lines are grouped into chunks of about chunk_size bytes, so only one
+    chunk is held in memory at a time.
+    
+    Args:
+        records: JSON-serializable records
+        chunk_size: Approximate chunk size in bytes
+        
+    Yields:
+        Chunks of complete NDJSON lines
+    """
+    lines = []
+    size = 0
+    
+    for record in records:
+        line = dumps(record) + b'\n'
+        lines.append(line)
+        size += len(line)
+        if size >= chunk_size:
+            yield b''.join(lines)
+            lines = []
+            size = 0
+    
+    if lines:
+        yield b''.join(lines)
+
+
+def gzip_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Compress a byte stream into a gzip stream
+    
+    Args:
+        chunks: Uncompressed chunks
+        
+    Yields:
+        Gzip-compressed chunks
+    """
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    
+    yield compressor.flush()
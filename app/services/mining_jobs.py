@@ -0,0 +1,215 @@
+"""
+Mining Job Service
+Runs mining in the background so requests don't wait on proof-of-work
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional
+from .blockchain_service import BlockchainService
+
+
+# Job states
+JOB_QUEUED = 'queued'
+JOB_RUNNING = 'running'
+JOB_COMPLETED = 'completed'
+JOB_FAILED = 'failed'
+JOB_CANCELLED = 'cancelled'
+
+ACTIVE_STATES = (JOB_QUEUED, JOB_RUNNING)
+
+
+class MiningJob:
+    """A mining request executed in the background"""
+    
+    def __init__(self, miner_address: str):
+        """
+        Initialize a mining job
+        
+        Args:
+            miner_address: Address to receive mining reward
+        """
+        self.id = uuid.uuid4().hex
+        self.miner_address = miner_address
+        self.status = JOB_QUEUED
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.cancel_event = threading.Event()
+        self.future = None
+    
+    @property
+    def is_active(self) -> bool:
+        """True while the job is queued or running"""
+        return self.status in ACTIVE_STATES
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert job to dictionary
+        
+        Returns:
+            Dictionary representation of the job
+        """
+        return {
+            'job_id': self.id,
+            'miner_address': self.miner_address,
+            'status': self.status,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'result': self.result,
+            'error': self.error
+        }
+
+
+class MiningJobManager:
+    """Queues mining jobs and runs them off the event loop"""
+    
+    def __init__(self, service: BlockchainService, max_jobs: int = 4, history: int = 100):
+        """
+        Initialize the job manager
+        
+        Args:
+            service: Blockchain service used to mine
+            max_jobs: Maximum number of queued + running jobs
+            history: Number of finished jobs kept for status queries
+        """
+        self.service = service
+        self.max_jobs = max_jobs
+        self.history = history
+        self._jobs: "OrderedDict[str, MiningJob]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Blocks extend the tip one after another, so jobs run one at a time
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='mining-job')
+    
+    def submit(self, miner_address: str) -> Dict[str, Any]:
+        """
+        Queue a mining job
+        
+        Args:
+            miner_address: Address to receive mining reward
+            
+        Returns:
+            Result dictionary with the queued job
+        """
+        with self._lock:
+            active = sum(1 for job in self._jobs.values() if job.is_active)
+            if active >= self.max_jobs:
+                return {
+                    'success': False,
+                    'message': f'Too many mining jobs (limit {self.max_jobs})',
+                    'job': None
+                }
+            
+            job = MiningJob(miner_address)
+            self._jobs[job.id] = job
+            self._prune()
+            job.future = self._executor.submit(self._run, job)
+        
+        return {
+            'success': True,
+            'message': 'Mining job queued',
+            'job': job.to_dict()
+        }
+    
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a job by its id
+        
+        Args:
+            job_id: Job id
+            
+        Returns:
+            Job dictionary or None
+        """
+        job = self._jobs.get(job_id)
+        return job.to_dict() if job else None
+    
+    def cancel(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Cancel a queued or running job
+        
+        Args:
+            job_id: Job id
+            
+        Returns:
+            Job dictionary or None if the job doesn't exist
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            
+            if job.is_active:
+                job.cancel_event.set()
+                
+                # A job that hasn't started is dropped from the queue
+                if job.future.cancel():
+                    self._finish(job, JOB_CANCELLED)
+        
+        return job.to_dict()
+    
+    def cancel_all(self) -> int:
+        """
+        Cancel every queued or running job
+        
+        Returns:
+            Number of jobs cancelled
+        """
+        with self._lock:
+            active = [job for job in self._jobs.values() if job.is_active]
+            for job in active:
+                job.cancel_event.set()
+                if job.future.cancel():
+                    self._finish(job, JOB_CANCELLED)
+        
+        return len(active)
+    
+    def _run(self, job: MiningJob) -> None:
+        """Execute a job on the worker thread"""
+        with self._lock:
+            if job.cancel_event.is_set():
+                self._finish(job, JOB_CANCELLED)
+                return
+            job.status = JOB_RUNNING
+            job.started_at = time.time()
+        
+        try:
+            result = self.service.mine_block(job.miner_address, job.cancel_event)
+        except Exception as e:
+            result = {'success': False, 'message': f'Error mining block: {str(e)}'}
+        
+        with self._lock:
+            job.result = result
+            if result.get('cancelled'):
+                self._finish(job, JOB_CANCELLED)
+            elif result['success']:
+                self._finish(job, JOB_COMPLETED)
+            else:
+                job.error = result['message']
+                self._finish(job, JOB_FAILED)
+    
+    @staticmethod
+    def _finish(job: MiningJob, status: str) -> None:
+        """Mark a job as finished"""
+        job.status = status
+        job.finished_at = time.time()
+    
+    def _prune(self) -> None:
+        """Forget the oldest finished jobs beyond the history limit"""
+        finished = [job_id for job_id, job in self._jobs.items() if not job.is_active]
+        for job_id in finished[:max(0, len(finished) - self.history)]:
+            del self._jobs[job_id]
+    
+    def shutdown(self) -> None:
+        """Cancel all jobs and stop the worker thread"""
+        with self._lock:
+            for job in self._jobs.values():
+                job.cancel_event.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
@@ -0,0 +1,226 @@
+"""
+Persistence Queue
+Writes mined blocks to the database in the background, in chain order
+"""
+
+import threading
+import time
+from collections import deque
+from typing import List, Dict, Any, Optional
+from .storage import BlockConflictError
+
+
+class PersistenceQueue:
+    """
+    Ordered write-behind queue of blocks waiting to be saved
+    
+    A single background thread takes up to batch_size consecutive blocks off
+    the head of the queue and saves them with one store.save_blocks() call.
+    A failed batch stays at the head and is retried with exponential backoff,
+    so a block is never persisted before the blocks preceding it.
+    
+    A BlockConflictError (a different block already stored at that height)
+    won't go away by retrying: the queue halts with the batch kept at the
+    head and the error in last_error, until clear() is called.
+    """
+    
+    def __init__(
+        self,
+        store,
+        batch_size: int = 16,
+        retry_delay: float = 0.5,
+        max_retry_delay: float = 30.0
+    ):
+        """
+        Initialize a persistence queue
+        
+        Args:
+            store: Object with a save_blocks(blocks_data) -> bool method
+            batch_size: Maximum number of blocks saved per batch
+            retry_delay: Delay before the first retry of a failed batch (seconds)
+            max_retry_delay: Upper bound for the retry delay (seconds)
+        """
+        self.store = store
+        self.batch_size = max(batch_size, 1)
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        
+        self._queue: deque = deque()
+        self._in_flight: List[Dict[str, Any]] = []
+        # Transactions in the queued and in-flight blocks
+        self._pending_transactions = 0
+        self._condition = threading.Condition()
+        # Bumped by clear() so a batch that is being retried gets dropped
+        self._generation = 0
+        self._stopped = False
+        
+        self.last_persisted_height: Optional[int] = None
+        self.failures = 0
+        self.last_error: Optional[str] = None
+        # Set when a conflicting block was found, cleared by clear()
+        self.halted = False
+        
+        self._thread = threading.Thread(target=self._run, name='persistence', daemon=True)
+        self._thread.start()
+    
+    @property
+    def depth(self) -> int:
+        """Number of blocks not persisted yet (queued or being written)"""
+        with self._condition:
+            return len(self._queue) + len(self._in_flight)
+    
+    def enqueue(self, block_data: Dict[str, Any]) -> None:
+        """
+        Queue a block for saving (returns immediately)
+        
+        Args:
+            block_data: Block data dictionary, blocks must be queued in chain order
+        """
+        with self._condition:
+            self._queue.append(block_data)
+            self._pending_transactions += len(block_data['transactions'])
+            self._condition.notify_all()
+    
+    def _run(self) -> None:
+        """Save batches until stopped (background thread)"""
+        while True:
+            with self._condition:
+                while (not self._queue or self.halted) and not self._stopped:
+                    self._condition.wait()
+                if self._stopped:
+                    return
+                
+                count = min(self.batch_size, len(self._queue))
+                self._in_flight = [self._queue.popleft() for _ in range(count)]
+                batch = self._in_flight
+                generation = self._generation
+            
+            delay = self.retry_delay
+            while True:
+                try:
+                    saved = self._save(batch)
+                except BlockConflictError as e:
+                    with self._condition:
+                        if generation == self._generation:
+                            self.failures += 1
+                            self.last_error = str(e)
+                            self.halted = True
+                            print(f"✗ Persistence halted: {e}")
+                    break
+                
+                with self._condition:
+                    if generation != self._generation or self._stopped:
+                        break
+                    
+                    if saved:
+                        self.last_persisted_height = batch[-1]['index']
+                        self.last_error = None
+                        break
+                    
+                    self.failures += 1
+                    # Sleep on the condition so clear() and shutdown() wake the retry up
+                    self._condition.wait(delay)
+                    if generation != self._generation or self._stopped:
+                        break
+                
+                delay = min(delay * 2, self.max_retry_delay)
+            
+            with self._condition:
+                if self._in_flight is batch:
+                    self._in_flight = []
+                    if self.halted:
+                        # Keep the unsaved batch at the head until clear()
+                        self._queue.extendleft(reversed(batch))
+                    else:
+                        self._pending_transactions -= sum(len(block['transactions']) for block in batch)
+                self._condition.notify_all()
+    
+    def _save(self, batch: List[Dict[str, Any]]) -> bool:
+        """Write one batch, recording the error on failure (conflicts are raised)"""
+        try:
+            if self.store.save_blocks(batch):
+                return True
+            first, last = batch[0]['index'], batch[-1]['index']
+            self.last_error = f"Saving block {first} failed" if first == last else f"Saving blocks {first}-{last} failed"
+        except BlockConflictError:
+            raise
+        except Exception as e:
+            self.last_error = str(e)
+        return False
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued block is persisted
+        
+        Args:
+            timeout: Maximum wait in seconds (None = no limit)
+            
+        Returns:
+            True if the queue was drained, False on timeout or when halted
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        
+        with self._condition:
+            while self._queue or self._in_flight:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if self.halted or (remaining is not None and remaining <= 0):
+                    return False
+                self._condition.wait(remaining)
+        return True
+    
+    def clear(self, last_persisted_height: Optional[int] = None) -> None:
+        """
+        Drop every queued block and wait for the batch being written
+        
+        Used before the database is wiped, so no old block is written after it.
+        
+        Args:
+            last_persisted_height: Height already present in the database afterwards
+        """
+        with self._condition:
+            self._queue.clear()
+            self._generation += 1
+            self.halted = False
+            self._condition.notify_all()
+            while self._in_flight:
+                self._condition.wait()
+            self._pending_transactions = 0
+            self.last_persisted_height = last_persisted_height
+            self.last_error = None
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get queue statistics
+        
+        Returns:
+            Dictionary with queue depth, last persisted height and errors
+        """
+        with self._condition:
+            return {
+                'queue_depth': len(self._queue) + len(self._in_flight),
+                'queued_transactions': self._pending_transactions,
+                'last_persisted_height': self.last_persisted_height,
+                'failures': self.failures,
+                'last_error': self.last_error,
+                'halted': self.halted
+            }
+    
+    def shutdown(self, timeout: Optional[float] = None) -> int:
+        """
+        Flush the queue and stop the background thread
+        
+        Args:
+            timeout: Maximum time to wait for the flush in seconds
+            
+        Returns:
+            Number of blocks left unsaved
+        """
+        self.flush(timeout)
+        
+        with self._condition:
+            unsaved = len(self._queue) + len(self._in_flight)
+            self._stopped = True
+            self._condition.notify_all()
+        self._thread.join(timeout=1.0)
+        
+        return unsaved
@@ -0,0 +1,402 @@
+"""
+SQLite Storage
+Embedded block store for single-node deployments (no network hop)
+"""
+
+import json
+import sqlite3
+import threading
+from typing import List, Dict, Any, Iterator, Optional
+from ..config.settings import settings
+from .storage import BlockConflictError
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS blocks (
+    block_index INTEGER PRIMARY KEY,
+    timestamp REAL NOT NULL,
+    transactions TEXT NOT NULL,
+    previous_hash TEXT NOT NULL,
+    nonce INTEGER NOT NULL,
+    hash TEXT NOT NULL,
+    merkle_root TEXT,
+    version INTEGER NOT NULL DEFAULT 1
+);
+
+CREATE TABLE IF NOT EXISTS transactions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    block_index INTEGER NOT NULL,
+    sender TEXT NOT NULL,
+    recipient TEXT NOT NULL,
+    amount REAL NOT NULL,
+    fee REAL NOT NULL DEFAULT 0,
+    timestamp REAL NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_blocks_hash ON blocks(hash);
+CREATE INDEX IF NOT EXISTS idx_transactions_block ON transactions(block_index);
+CREATE INDEX IF NOT EXISTS idx_transactions_sender ON transactions(sender);
+CREATE INDEX IF NOT EXISTS idx_transactions_recipient ON transactions(recipient);
+CREATE INDEX IF NOT EXISTS idx_transactions_timestamp ON transactions(timestamp);
+"""
+
+BLOCK_COLUMNS = 'block_index, timestamp, transactions, previous_hash, nonce, hash, merkle_root, version'
+TRANSACTION_COLUMNS = 'id, block_index, sender, recipient, amount, fee, timestamp'
+
+
+class SQLiteStorage:
+    """Block store in a local SQLite database in WAL mode (implements StorageBackend)"""
+    
+    def __init__(self, path: str):
+        """
+        Open (or create) the database
+        
+        Each thread gets its own connection, so readers are not blocked by
+        the background writer.
+        
+        Args:
+            path: Database file path
+        """
+        self.path = path
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        
+        with self._connection() as conn:
+            conn.executescript(SCHEMA)
+        print(f"✓ SQLite storage ready at {path}")
+    
+    def _connection(self) -> sqlite3.Connection:
+        """Get the connection of the calling thread"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+    
+    @staticmethod
+    def _block_data(row: sqlite3.Row) -> Dict[str, Any]:
+        """Convert a blocks row to block data"""
+        block = dict(row)
+        block['transactions'] = json.loads(block['transactions'])
+        block['index'] = block['block_index']
+        return block
+    
+    # ==================== BLOCK OPERATIONS ====================
+    
+    def save_block(self, block_data: Dict[str, Any]) -> bool:
+        """
+        Save a block and its transactions to the database
+        
+        Args:
+            block_data: Block data dictionary
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        return self.save_blocks([block_data])
+    
+    def save_blocks(self, blocks_data: List[Dict[str, Any]]) -> bool:
+        """
+        Save consecutive blocks and their transactions in one database transaction
+        
+        Rows are written with executemany. A block that is already stored
+        with the same hash is skipped, so a save can be retried; a different
+        block at the same index fails the whole save.
+        
+        Args:
+            blocks_data: Block data dictionaries
+            
+        Returns:
+            True if successful, False otherwise
+            
+        Raises:
+            BlockConflictError: A different block is stored at one of the indexes
+        """
+        if not blocks_data:
+            return True
+        
+        try:
+            block_rows = [
+                (
+                    block_data['index'],
+                    block_data['timestamp'],
+                    json.dumps(block_data['transactions']),
+                    block_data['previous_hash'],
+                    block_data['nonce'],
+                    block_data['hash'],
+                    block_data['merkle_root'],
+                    block_data['version']
+                )
+                for block_data in blocks_data
+            ]
+            tx_rows = [
+                (
+                    block_data['index'],
+                    tx['sender'],
+                    tx['recipient'],
+                    tx['amount'],
+                    tx.get('fee', 0.0),
+                    tx['timestamp']
+                )
+                for block_data in blocks_data
+                for tx in block_data['transactions']
+            ]
+            
+            conn = self._connection()
+            with self._write_lock, conn:
+                stored = self._stored_hashes(conn, [row[0] for row in block_rows])
+                for row in block_rows:
+                    if row[0] in stored and stored[row[0]] != row[5]:
+                        raise BlockConflictError(
+                            f"Block {row[0]} is already stored with hash {stored[row[0]]}, not {row[5]}"
+                        )
+                
+                # Blocks already stored are complete, their transaction rows are left alone
+                block_rows = [row for row in block_rows if row[0] not in stored]
+                tx_rows = [row for row in tx_rows if row[0] not in stored]
+                conn.executemany('DELETE FROM transactions WHERE block_index = ?', [(row[0],) for row in block_rows])
+                conn.executemany(
+                    'INSERT INTO transactions (block_index, sender, recipient, amount, fee, timestamp) '
+                    'VALUES (?, ?, ?, ?, ?, ?)',
+                    tx_rows
+                )
+                conn.executemany(
+                    f'INSERT INTO blocks ({BLOCK_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                    block_rows
+                )
+            
+            first, last = blocks_data[0]['index'], blocks_data[-1]['index']
+            label = f"{first}" if first == last else f"{first}-{last}"
+            print(f"✓ Block {label} saved to SQLite ({len(tx_rows)} transactions)")
+            return True
+        
+        except BlockConflictError as e:
+            print(f"✗ Error saving block: {e}")
+            raise
+        
+        except Exception as e:
+            print(f"✗ Error saving block: {e}")
+            return False
+    
+    @staticmethod
+    def _stored_hashes(conn: sqlite3.Connection, indexes: List[int]) -> Dict[int, str]:
+        """Get the hashes of the stored blocks among some indexes"""
+        placeholders = ', '.join('?' * len(indexes))
+        rows = conn.execute(
+            f'SELECT block_index, hash FROM blocks WHERE block_index IN ({placeholders})',
+            indexes
+        ).fetchall()
+        return {row['block_index']: row['hash'] for row in rows}
+    
+    def get_block_by_index(self, index: int) -> Optional[Dict[str, Any]]:
+        """
+        Get a block by its index
+        
+        Args:
+            index: Block index
+            
+        Returns:
+            Block data or None
+        """
+        try:
+            row = self._connection().execute(
+                f'SELECT {BLOCK_COLUMNS} FROM blocks WHERE block_index = ?',
+                (index,)
+            ).fetchone()
+            return self._block_data(row) if row else None
+        
+        except Exception as e:
+            print(f"✗ Error getting block: {e}")
+            return None
+    
+    def _fetch_block_page(self, start: int, limit: int) -> List[sqlite3.Row]:
+        """Fetch up to `limit` rows with block_index >= start (errors are raised)"""
+        return self._connection().execute(
+            f'SELECT {BLOCK_COLUMNS} FROM blocks WHERE block_index >= ? ORDER BY block_index LIMIT ?',
+            (start, limit)
+        ).fetchall()
+    
+    def iter_blocks(
+        self,
+        start: int = 0,
+        page_size: Optional[int] = None,
+        prefetch: Optional[bool] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream blocks in index order, one keyset page at a time
+        
+        Reads are local, so prefetch is accepted for compatibility and ignored.
+        Errors are raised to the caller.
+        
+        Args:
+            start: First block index
+            page_size: Blocks per query (default: DB_PAGE_SIZE)
+            prefetch: Ignored
+            
+        Yields:
+            Block data dictionaries
+        """
+        page_size = max(page_size or settings.DB_PAGE_SIZE, 1)
+        page = self._fetch_block_page(start, page_size)
+        
+        while page:
+            cursor = page[-1]['block_index'] + 1
+            for row in page:
+                yield self._block_data(row)
+            page = self._fetch_block_page(cursor, page_size)
+    
+    def get_blocks(self, start: int, limit: int) -> List[Dict[str, Any]]:
+        """
+        Get up to `limit` consecutive blocks starting at a block index
+        
+        Args:
+            start: First block index
+            limit: Maximum number of blocks
+            
+        Returns:
+            List of block data
+        """
+        try:
+            return [self._block_data(row) for row in self._fetch_block_page(start, limit)]
+        
+        except Exception as e:
+            print(f"✗ Error getting blocks: {e}")
+            return []
+    
+    def get_all_blocks(self) -> List[Dict[str, Any]]:
+        """
+        Get all blocks from the database
+        
+        Returns:
+            List of block data
+        """
+        try:
+            return list(self.iter_blocks())
+        
+        except Exception as e:
+            print(f"✗ Error getting blocks: {e}")
+            return []
+    
+    def get_latest_block(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the latest block from the database
+        
+        Returns:
+            Latest block data or None
+        """
+        try:
+            row = self._connection().execute(
+                f'SELECT {BLOCK_COLUMNS} FROM blocks ORDER BY block_index DESC LIMIT 1'
+            ).fetchone()
+            return self._block_data(row) if row else None
+        
+        except Exception as e:
+            print(f"✗ Error getting latest block: {e}")
+            return None
+    
+    def delete_all_blocks(self) -> bool:
+        """
+        Delete all blocks and their transactions (use with caution!)
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            conn = self._connection()
+            with self._write_lock, conn:
+                conn.execute('DELETE FROM transactions')
+                conn.execute('DELETE FROM blocks')
+            print("✓ All blocks deleted")
+            return True
+        except Exception as e:
+            print(f"✗ Error deleting blocks: {e}")
+            return False
+    
+    # ==================== TRANSACTION OPERATIONS ====================
+    
+    def _query_transactions(self, where: str, params: tuple) -> List[Dict[str, Any]]:
+        """Select transaction rows as dictionaries"""
+        rows = self._connection().execute(
+            f'SELECT {TRANSACTION_COLUMNS} FROM transactions {where}',
+            params
+        ).fetchall()
+        return [dict(row) for row in rows]
+    
+    def get_transactions_by_block(self, block_index: int) -> List[Dict[str, Any]]:
+        """
+        Get all transactions in a specific block
+        
+        Args:
+            block_index: Block index
+            
+        Returns:
+            List of transaction data
+        """
+        try:
+            return self._query_transactions('WHERE block_index = ? ORDER BY id', (block_index,))
+        
+        except Exception as e:
+            print(f"✗ Error getting transactions: {e}")
+            return []
+    
+    def get_transactions_by_address(self, address: str) -> List[Dict[str, Any]]:
+        """
+        Get all transactions involving an address
+        
+        Args:
+            address: Wallet address
+            
+        Returns:
+            List of transaction data (sent first, then received)
+        """
+        try:
+            sent = self._query_transactions('WHERE sender = ? ORDER BY id', (address,))
+            received = self._query_transactions('WHERE recipient = ? ORDER BY id', (address,))
+            return sent + received
+        
+        except Exception as e:
+            print(f"✗ Error getting transactions: {e}")
+            return []
+    
+    def get_all_transactions(self) -> List[Dict[str, Any]]:
+        """
+        Get all transactions from the database
+        
+        Returns:
+            List of transaction data
+        """
+        try:
+            return self._query_transactions('ORDER BY timestamp', ())
+        
+        except Exception as e:
+            print(f"✗ Error getting all transactions: {e}")
+            return []
+    
+    # ==================== UTILITY OPERATIONS ====================
+    
+    def get_blockchain_stats(self) -> Dict[str, Any]:
+        """
+        Get blockchain statistics from database
+        
+        Returns:
+            Statistics dictionary
+        """
+        try:
+            conn = self._connection()
+            total_blocks = conn.execute('SELECT COUNT(*) FROM blocks').fetchone()[0]
+            total_transactions = conn.execute('SELECT COUNT(*) FROM transactions').fetchone()[0]
+            
+            return {
+                'total_blocks': total_blocks,
+                'total_transactions': total_transactions
+            }
+        
+        except Exception as e:
+            print(f"✗ Error getting stats: {e}")
+            return {
+                'total_blocks': 0,
+                'total_transactions': 0
+            }
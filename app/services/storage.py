@@ -0,0 +1,159 @@
+"""
+Storage Backends
+Interface shared by the block stores and selection of the configured one
+"""
+
+import asyncio
+from typing import List, Dict, Any, Iterator, Optional, Protocol
+from ..config.settings import settings
+
+
+class BlockConflictError(Exception):
+    """Raised when a block is saved at an index that already holds a different block"""
+    pass
+
+
+class StorageBackend(Protocol):
+    """
+    Block and transaction store used by the blockchain service
+    
+    Block data dictionaries carry both 'index' and 'block_index' and a parsed
+    'transactions' list; transaction rows carry block_index, sender,
+    recipient, amount, fee and timestamp. Read methods return empty results
+    on errors, except iter_blocks() which raises so callers can tell an
+    unreachable store from an empty one.
+    """
+    
+    def save_block(self, block_data: Dict[str, Any]) -> bool:
+        """Save a block and its transactions"""
+        ...
+    
+    def save_blocks(self, blocks_data: List[Dict[str, Any]]) -> bool:
+        """
+        Save consecutive blocks and their transactions, all or nothing
+        
+        A block already stored with the same hash counts as saved and is left
+        untouched; a different stored block raises BlockConflictError.
+        """
+        ...
+    
+    def get_block_by_index(self, index: int) -> Optional[Dict[str, Any]]:
+        """Get a block by its index"""
+        ...
+    
+    def get_blocks(self, start: int, limit: int) -> List[Dict[str, Any]]:
+        """Get up to `limit` blocks with index >= start, in index order"""
+        ...
+    
+    def iter_blocks(
+        self,
+        start: int = 0,
+        page_size: Optional[int] = None,
+        prefetch: Optional[bool] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream blocks with index >= start page by page, in index order"""
+        ...
+    
+    def get_all_blocks(self) -> List[Dict[str, Any]]:
+        """Get all blocks"""
+        ...
+    
+    def get_latest_block(self) -> Optional[Dict[str, Any]]:
+        """Get the block with the highest index"""
+        ...
+    
+    def delete_all_blocks(self) -> bool:
+        """Delete all blocks"""
+        ...
+    
+    def get_transactions_by_block(self, block_index: int) -> List[Dict[str, Any]]:
+        """Get the transactions of a block"""
+        ...
+    
+    def get_transactions_by_address(self, address: str) -> List[Dict[str, Any]]:
+        """Get the transactions sent or received by an address"""
+        ...
+    
+    def get_all_transactions(self) -> List[Dict[str, Any]]:
+        """Get all transactions ordered by timestamp"""
+        ...
+    
+    def get_blockchain_stats(self) -> Dict[str, Any]:
+        """Count stored blocks and transactions"""
+        ...
+
+
+def create_storage(backend: str) -> StorageBackend:
+    """
+    Create the storage backend selected by name
+    
+    Args:
+        backend: "supabase" or "sqlite"
+        
+    Returns:
+        Storage backend instance
+    """
+    backend = backend.lower()
+    
+    if backend == 'supabase':
+        from .supabase_service import supabase_service
+        return supabase_service
+    
+    if backend == 'sqlite':
+        from .sqlite_storage import SQLiteStorage
+        return SQLiteStorage(settings.SQLITE_PATH)
+    
+    raise ValueError(f"Unknown storage backend '{backend}', use 'supabase' or 'sqlite'")
+
+
+class ThreadedAsyncStorage:
+    """
+    Async facade over a synchronous storage backend
+    
+    Every call runs in a worker thread, so awaiting it never blocks the
+    event loop.
+    """
+    
+    def __init__(self, storage: StorageBackend):
+        """
+        Wrap a storage backend
+        
+        Args:
+            storage: Synchronous storage backend
+        """
+        self.storage = storage
+    
+    def __getattr__(self, name: str):
+        """Expose each backend method as a coroutine function"""
+        method = getattr(self.storage, name)
+        
+        async def call(*args, **kwargs):
+            return await asyncio.to_thread(method, *args, **kwargs)
+        
+        return call
+    
+    async def aclose(self) -> None:
+        """Nothing to close, the wrapped backend manages its connections"""
+        pass
+
+
+def create_async_storage(backend: str, storage: StorageBackend):
+    """
+    Create the async read layer for a storage backend
+    
+    Supabase gets a native async client with pooled connections, other
+    backends are wrapped to run in worker threads.
+    
+    Args:
+        backend: "supabase" or "sqlite"
+        storage: Synchronous backend created for the same name
+        
+    Returns:
+        Object with awaitable read methods and aclose()
+    """
+    if backend.lower() == 'supabase':
+        from .async_supabase_service import AsyncSupabaseService
+        return AsyncSupabaseService()
+    
+    return ThreadedAsyncStorage(storage)
+
@@ -4,21 +4,36 @@ Handles all database operations with Supabase
 """
 
 from supabase import create_client, Client
-from typing import List, Dict, Any, Optional
+from postgrest.types import ReturnMethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Iterator, Optional
+import itertools
 import json
+import threading
 from ..config.settings import settings
+from .storage import BlockConflictError
 
 
 class SupabaseService:
-    """Service for interacting with Supabase database"""
+    """Service for interacting with Supabase database (implements StorageBackend)"""
     
     def __init__(self):
-        """Initialize Supabase client"""
-        self.supabase: Client = create_client(
-            settings.SUPABASE_URL,
-            settings.SUPABASE_KEY
-        )
-        self._ensure_tables_exist()
+        """Initialize the service, the client connects on first use"""
+        self._client: Optional[Client] = None
+        self._client_lock = threading.Lock()
+    
+    @property
+    def supabase(self) -> Client:
+        """Supabase client, created and checked on first use"""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = create_client(
+                        settings.SUPABASE_URL,
+                        settings.SUPABASE_KEY
+                    )
+                    self._ensure_tables_exist()
+        return self._client
     
     def _ensure_tables_exist(self):
         """
@@ -38,7 +53,7 @@ class SupabaseService:
     
     def save_block(self, block_data: Dict[str, Any]) -> bool:
         """
-        Save a block to the database
+        Save a block and its transactions to the database
         
         Args:
             block_data: Block data dictionary
@@ -46,29 +61,105 @@ class SupabaseService:
         Returns:
             True if successful, False otherwise
         """
+        return self.save_blocks([block_data])
+    
+    def save_blocks(self, blocks_data: List[Dict[str, Any]]) -> bool:
+        """
+        Save consecutive blocks and their transactions to the database
+        
+        Transaction rows are written with bulk inserts of up to
+        DB_INSERT_CHUNK_SIZE rows, so the number of requests no longer grows
+        with the number of transactions. The block rows are written last and
+        mark the blocks as complete: if any insert fails, the transaction
+        rows already written for these blocks are deleted again. A block that
+        is already stored with the same hash is skipped, so a failed save can
+        be retried; a different block at the same index fails the save.
+        
+        Args:
+            blocks_data: Block data dictionaries
+            
+        Returns:
+            True if successful, False otherwise
+            
+        Raises:
+            BlockConflictError: A different block is stored at one of the indexes
+        """
+        if not blocks_data:
+            return True
+        
         try:
             # Prepare data for insertion
-            data = {
-                'block_index': block_data['index'],
-                'timestamp': block_data['timestamp'],
-                'transactions': json.dumps(block_data['transactions']),
-                'previous_hash': block_data['previous_hash'],
-                'nonce': block_data['nonce'],
-                'hash': block_data['hash']
-            }
+            block_rows = []
+            rows = []
+            for block_data in blocks_data:
+                block_rows.append({
+                    'block_index': block_data['index'],
+                    'timestamp': block_data['timestamp'],
+                    'transactions': json.dumps(block_data['transactions']),
+                    'previous_hash': block_data['previous_hash'],
+                    'nonce': block_data['nonce'],
+                    'hash': block_data['hash'],
+                    'merkle_root': block_data['merkle_root'],
+                    'version': block_data['version']
+                })
+                rows.extend(
+                    self._transaction_row(tx, block_data['index'])
+                    for tx in block_data['transactions']
+                )
+        except Exception as e:
+            print(f"✗ Error saving block: {e}")
+            return False
+        
+        first, last = blocks_data[0]['index'], blocks_data[-1]['index']
+        label = f"{first}" if first == last else f"{first}-{last}"
+        
+        try:
+            stored = self._stored_hashes([row['block_index'] for row in block_rows])
+        except Exception as e:
+            print(f"✗ Error saving block {label}: {e}")
+            return False
+        
+        for row in block_rows:
+            if row['block_index'] in stored and stored[row['block_index']] != row['hash']:
+                message = f"Block {row['block_index']} is already stored with hash {stored[row['block_index']]}, not {row['hash']}"
+                print(f"✗ Error saving block {label}: {message}")
+                raise BlockConflictError(message)
+        
+        # Blocks already stored are complete, their transaction rows are left alone
+        block_rows = [row for row in block_rows if row['block_index'] not in stored]
+        rows = [row for row in rows if row['block_index'] not in stored]
+        indexes = [row['block_index'] for row in block_rows]
+        if not indexes:
+            return True
+        
+        try:
+            # Drop rows left behind by an earlier failed attempt
+            self._delete_transactions_by_blocks(indexes)
             
-            # Insert into database
-            result = self.supabase.table('blocks').insert(data).execute()
+            # Insert transactions in bulk, then the block rows
+            chunk_size = max(settings.DB_INSERT_CHUNK_SIZE, 1)
+            for start in range(0, len(rows), chunk_size):
+                self.supabase.table('transactions')\
+                    .insert(rows[start:start + chunk_size], returning=ReturnMethod.minimal)\
+                    .execute()
             
-            # Save individual transactions
-            for tx in block_data['transactions']:
-                self.save_transaction(tx, block_data['index'])
+            self.supabase.table('blocks')\
+                .insert(block_rows, returning=ReturnMethod.minimal)\
+                .execute()
             
-            print(f"✓ Block {block_data['index']} saved to Supabase")
+            print(f"✓ Block {label} saved to Supabase ({len(rows)} transactions)")
             return True
             
         except Exception as e:
-            print(f"✗ Error saving block: {e}")
+            print(f"✗ Error saving block {label}: {e}")
+            try:
+                # Only blocks without a committed row, another writer may have stored some meanwhile
+                committed = self._stored_hashes(indexes)
+                orphaned = [index for index in indexes if index not in committed]
+                if orphaned:
+                    self._delete_transactions_by_blocks(orphaned)
+            except Exception as cleanup_error:
+                print(f"✗ Error cleaning up transactions of block {label}: {cleanup_error}")
             return False
     
     def get_block_by_index(self, index: int) -> Optional[Dict[str, Any]]:
@@ -100,6 +191,89 @@ class SupabaseService:
             print(f"✗ Error getting block: {e}")
             return None
     
+    def _fetch_block_page(self, start: int, limit: int) -> List[Dict[str, Any]]:
+        """
+        Fetch up to `limit` blocks with block_index >= start (errors are raised)
+        
+        Args:
+            start: First block index
+            limit: Maximum number of rows
+            
+        Returns:
+            Raw block rows ordered by block_index
+        """
+        result = self.supabase.table('blocks')\
+            .select('*')\
+            .gte('block_index', start)\
+            .order('block_index')\
+            .limit(limit)\
+            .execute()
+        return result.data
+    
+    def iter_blocks(
+        self,
+        start: int = 0,
+        page_size: Optional[int] = None,
+        prefetch: Optional[bool] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream blocks in index order, one keyset page at a time
+        
+        Each page continues after the last block_index of the previous one,
+        so a server-side row limit can shorten pages but never truncates the
+        chain. With prefetch, the next page is requested while the caller is
+        still consuming the current one. Errors are raised to the caller.
+        
+        Args:
+            start: First block index
+            page_size: Blocks per request (default: DB_PAGE_SIZE)
+            prefetch: Fetch the next page in the background (default: DB_PREFETCH)
+            
+        Yields:
+            Block data dictionaries
+        """
+        page_size = max(page_size or settings.DB_PAGE_SIZE, 1)
+        if prefetch is None:
+            prefetch = settings.DB_PREFETCH
+        
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='block-prefetch') if prefetch else None
+        
+        try:
+            page = self._fetch_block_page(start, page_size)
+            
+            while page:
+                cursor = page[-1]['block_index'] + 1
+                next_page = executor.submit(self._fetch_block_page, cursor, page_size) if executor else None
+                
+                for block in page:
+                    # Parse transactions JSON
+                    block['transactions'] = json.loads(block['transactions'])
+                    block['index'] = block['block_index']
+                    yield block
+                
+                page = next_page.result() if next_page else self._fetch_block_page(cursor, page_size)
+        finally:
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+    
+    def get_blocks(self, start: int, limit: int) -> List[Dict[str, Any]]:
+        """
+        Get up to `limit` consecutive blocks starting at a block index
+        
+        Args:
+            start: First block index
+            limit: Maximum number of blocks
+            
+        Returns:
+            List of block data
+        """
+        try:
+            return list(itertools.islice(self.iter_blocks(start, page_size=limit, prefetch=False), limit))
+            
+        except Exception as e:
+            print(f"✗ Error getting blocks: {e}")
+            return []
+    
     def get_all_blocks(self) -> List[Dict[str, Any]]:
         """
         Get all blocks from the database
@@ -108,19 +282,7 @@ class SupabaseService:
             List of block data
         """
         try:
-            result = self.supabase.table('blocks')\
-                .select('*')\
-                .order('block_index')\
-                .execute()
-            
-            blocks = []
-            for block in result.data:
-                # Parse transactions JSON
-                block['transactions'] = json.loads(block['transactions'])
-                block['index'] = block['block_index']
-                blocks.append(block)
-            
-            return blocks
+            return list(self.iter_blocks())
             
         except Exception as e:
             print(f"✗ Error getting blocks: {e}")
@@ -169,6 +331,55 @@ class SupabaseService:
     
     # ==================== TRANSACTION OPERATIONS ====================
     
+    @staticmethod
+    def _transaction_row(tx_data: Dict[str, Any], block_index: int) -> Dict[str, Any]:
+        """
+        Build the database row of a transaction
+        
+        Args:
+            tx_data: Transaction data dictionary
+            block_index: Index of the block containing this transaction
+            
+        Returns:
+            Row for the transactions table
+        """
+        return {
+            'block_index': block_index,
+            'sender': tx_data['sender'],
+            'recipient': tx_data['recipient'],
+            'amount': tx_data['amount'],
+            'timestamp': tx_data['timestamp'],
+            'fee': tx_data.get('fee', 0.0)
+        }
+    
+    def _stored_hashes(self, block_indexes: List[int]) -> Dict[int, str]:
+        """
+        Get the hashes of the stored blocks among some indexes (errors are raised)
+        
+        Args:
+            block_indexes: Block indexes
+            
+        Returns:
+            Stored hash per block index
+        """
+        result = self.supabase.table('blocks')\
+            .select('block_index, hash')\
+            .in_('block_index', block_indexes)\
+            .execute()
+        return {row['block_index']: row['hash'] for row in result.data}
+    
+    def _delete_transactions_by_blocks(self, block_indexes: List[int]) -> None:
+        """
+        Delete every transaction row of some blocks (errors are raised)
+        
+        Args:
+            block_indexes: Block indexes
+        """
+        self.supabase.table('transactions')\
+            .delete(returning=ReturnMethod.minimal)\
+            .in_('block_index', block_indexes)\
+            .execute()
+    
     def save_transaction(self, tx_data: Dict[str, Any], block_index: int) -> bool:
         """
         Save a transaction to the database
@@ -181,15 +392,8 @@ class SupabaseService:
             True if successful, False otherwise
         """
         try:
-            data = {
-                'block_index': block_index,
-                'sender': tx_data['sender'],
-                'recipient': tx_data['recipient'],
-                'amount': tx_data['amount'],
-                'timestamp': tx_data['timestamp']
-            }
-            
-            self.supabase.table('transactions').insert(data).execute()
+            data = self._transaction_row(tx_data, block_index)
+            self.supabase.table('transactions').insert(data, returning=ReturnMethod.minimal).execute()
             return True
             
         except Exception as e:
@@ -273,23 +477,25 @@ class SupabaseService:
         """
         Get blockchain statistics from database
         
+        Only the exact counts are requested (HEAD), no row is downloaded.
+        
         Returns:
             Statistics dictionary
         """
         try:
             # Count blocks
             blocks_result = self.supabase.table('blocks')\
-                .select('*', count='exact')\
+                .select('*', count='exact', head=True)\
                 .execute()
             
             # Count transactions
             tx_result = self.supabase.table('transactions')\
-                .select('*', count='exact')\
+                .select('*', count='exact', head=True)\
                 .execute()
             
             return {
-                'total_blocks': blocks_result.count if hasattr(blocks_result, 'count') else len(blocks_result.data),
-                'total_transactions': tx_result.count if hasattr(tx_result, 'count') else len(tx_result.data)
+                'total_blocks': blocks_result.count or 0,
+                'total_transactions': tx_result.count or 0
             }
             
         except Exception as e:
@@ -0,0 +1,81 @@
+"""
+Benchmark Script untuk Proof-of-Work
+Membandingkan hash rate loop mining lama dengan search kernel (midstate + batch)
+"""
+
+import time
+
+from app.models.block import Block
+from app.models.pow import search_nonce
+from app.models.transaction import Transaction
+
+# Jumlah nonce yang dicoba per pengukuran
+ATTEMPTS = 4096 * 128
+
+# Difficulty yang tidak mungkin tercapai, supaya semua nonce benar-benar dicoba
+UNREACHABLE_DIFFICULTY = 64
+
+
+def legacy_loop(block: Block, attempts: int, difficulty: int) -> None:
+    """Loop mining sebelum search kernel: rehash header + bandingkan hexdigest"""
+    target = '0' * difficulty
+    header = block.header
+    
+    for nonce in range(attempts):
+        header.nonce = nonce
+        if header.calculate_hash()[:difficulty] == target:
+            break
+
+
+def measure(label: str, func) -> float:
+    """Jalankan func dan cetak hash rate-nya"""
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    rate = ATTEMPTS / elapsed
+    print(f"{label:<28} {rate:>14,.0f} H/s  ({elapsed:.2f}s)")
+    return rate
+
+
+def main():
+    """Bandingkan kedua implementasi pada block yang sama"""
+    transactions = [Transaction(f"Sender{i}", "Recipient", 1.0) for i in range(1000)]
+    block = Block(index=1, transactions=transactions, previous_hash="ab" * 32)
+    prefix = block.header.serialize_prefix()
+    
+    print("=" * 60)
+    print(f"  Proof-of-work benchmark ({ATTEMPTS:,} hashes)")
+    print("=" * 60)
+    
+    legacy_rate = measure(
+        "Legacy loop",
+        lambda: legacy_loop(block, ATTEMPTS, UNREACHABLE_DIFFICULTY)
+    )
+    
+    class StopAfter:
+        """Stop flag yang berhenti setelah sejumlah batch"""
+        
+        def __init__(self, batches: int):
+            self.batches = batches
+        
+        def is_set(self) -> bool:
+            self.batches -= 1
+            return self.batches < 0
+    
+    batch_size = 4096
+    kernel_rate = measure(
+        "Search kernel",
+        lambda: search_nonce(
+            prefix,
+            UNREACHABLE_DIFFICULTY,
+            batch_size=batch_size,
+            stop_event=StopAfter(ATTEMPTS // batch_size)
+        )
+    )
+    
+    print("-" * 60)
+    print(f"Speedup: {kernel_rate / legacy_rate:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
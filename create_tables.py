@@ -18,8 +18,10 @@ CREATE TABLE IF NOT EXISTS blocks (
     timestamp DOUBLE PRECISION NOT NULL,
     transactions JSONB NOT NULL,
     previous_hash TEXT NOT NULL,
-    nonce INTEGER NOT NULL,
+    nonce BIGINT NOT NULL,
     hash TEXT NOT NULL,
+    merkle_root TEXT,
+    version INTEGER NOT NULL DEFAULT 1,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
@@ -30,10 +32,17 @@ CREATE TABLE IF NOT EXISTS transactions (
     sender TEXT NOT NULL,
     recipient TEXT NOT NULL,
     amount DOUBLE PRECISION NOT NULL,
+    fee DOUBLE PRECISION NOT NULL DEFAULT 0,
     timestamp DOUBLE PRECISION NOT NULL,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
+-- Migrasi untuk tabel yang sudah ada (block header + Merkle root)
+ALTER TABLE blocks ADD COLUMN IF NOT EXISTS merkle_root TEXT;
+ALTER TABLE blocks ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 1;
+ALTER TABLE blocks ALTER COLUMN nonce TYPE BIGINT;
+ALTER TABLE transactions ADD COLUMN IF NOT EXISTS fee DOUBLE PRECISION NOT NULL DEFAULT 0;
+
 -- Index untuk meningkatkan performa query
 CREATE INDEX IF NOT EXISTS idx_blocks_index ON blocks(block_index);
 CREATE INDEX IF NOT EXISTS idx_blocks_hash ON blocks(hash);
@@ -9,8 +9,10 @@ CREATE TABLE IF NOT EXISTS blocks (
     timestamp DOUBLE PRECISION NOT NULL,
     transactions JSONB NOT NULL,
     previous_hash TEXT NOT NULL,
-    nonce INTEGER NOT NULL,
+    nonce BIGINT NOT NULL,
     hash TEXT NOT NULL,
+    merkle_root TEXT,
+    version INTEGER NOT NULL DEFAULT 1,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
@@ -21,10 +23,17 @@ CREATE TABLE IF NOT EXISTS transactions (
     sender TEXT NOT NULL,
     recipient TEXT NOT NULL,
     amount DOUBLE PRECISION NOT NULL,
+    fee DOUBLE PRECISION NOT NULL DEFAULT 0,
     timestamp DOUBLE PRECISION NOT NULL,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
+-- Migrasi untuk tabel yang sudah ada (block header + Merkle root)
+ALTER TABLE blocks ADD COLUMN IF NOT EXISTS merkle_root TEXT;
+ALTER TABLE blocks ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 1;
+ALTER TABLE blocks ALTER COLUMN nonce TYPE BIGINT;
+ALTER TABLE transactions ADD COLUMN IF NOT EXISTS fee DOUBLE PRECISION NOT NULL DEFAULT 0;
+
 -- Index untuk meningkatkan performa query
 CREATE INDEX IF NOT EXISTS idx_blocks_index ON blocks(block_index);
 CREATE INDEX IF NOT EXISTS idx_blocks_hash ON blocks(hash);
@@ -41,3 +50,5 @@ COMMENT ON COLUMN blocks.transactions IS 'JSON array of transactions in this blo
 COMMENT ON COLUMN blocks.previous_hash IS 'Hash of the previous block';
 COMMENT ON COLUMN blocks.nonce IS 'Proof-of-work nonce';
 COMMENT ON COLUMN blocks.hash IS 'SHA-256 hash of this block';
+COMMENT ON COLUMN blocks.merkle_root IS 'Merkle root of the block transaction hashes';
+COMMENT ON COLUMN blocks.version IS 'Block format version (1 = full-body hash, 2 = header hash)';
@@ -5,7 +5,9 @@ Script ini menguji semua endpoint API
 
 import requests
 import json
+import threading
 import time
+from collections import Counter
 
 # Base URL
 BASE_URL = "http://localhost:8001/api"
@@ -21,6 +23,22 @@ def print_response(response):
     print(f"Status: {response.status_code}")
     print(f"Response: {json.dumps(response.json(), indent=2)}")
 
+def wait_until_ready(timeout=120):
+    """Wait until the server has loaded the blockchain"""
+    ready_url = BASE_URL.rsplit("/api", 1)[0] + "/ready"
+    deadline = time.time() + timeout
+    
+    while True:
+        response = requests.get(ready_url)
+        status = response.json()
+        if status["ready"]:
+            print(f"✓ Server ready ({status['loaded_blocks']} blocks loaded in {status['elapsed']}s)")
+            return
+        if status["status"] == "failed" or time.time() > deadline:
+            raise RuntimeError(f"server not ready: {status}")
+        print(f"⏳ Loading: {status['phase']} ({status['loaded_blocks']} blocks)")
+        time.sleep(0.5)
+
 def test_api():
     """Test all API endpoints"""
     
@@ -61,6 +79,13 @@ def test_api():
     })
     print_response(response)
     
+    print_section("5b. Create Transactions in One Batch")
+    response = requests.post(f"{BASE_URL}/transactions/batch", json=[
+        {"sender": "Alice", "recipient": "Charlie", "amount": 5.0},
+        {"sender": "Charlie", "recipient": "Bob", "amount": 2.5, "fee": 0.1}
+    ])
+    print_response(response)
+    
     # 4. Get pending transactions
     print_section("6. Get Pending Transactions")
     response = requests.get(f"{BASE_URL}/transactions/pending")
@@ -74,11 +99,30 @@ def test_api():
     })
     print_response(response)
     
+    # Wait for the background mining job
+    job_id = response.json()["data"]["job_id"]
+    while True:
+        response = requests.get(f"{BASE_URL}/mine/{job_id}")
+        if response.json()["data"]["status"] not in ("queued", "running"):
+            break
+        time.sleep(0.5)
+    print_response(response)
+    
     # 6. Get updated chain
     print_section("8. Get Updated Blockchain")
     response = requests.get(f"{BASE_URL}/chain")
     print_response(response)
     
+    print_section("8b. Get Block Headers Page")
+    response = requests.get(f"{BASE_URL}/blocks", params={"from": 0, "limit": 1, "headers_only": "true"})
+    print_response(response)
+    
+    print_section("8c. Export Blocks as NDJSON")
+    response = requests.get(f"{BASE_URL}/export/blocks", params={"gzip": "true"})
+    lines = response.text.splitlines()
+    print(f"Status: {response.status_code}")
+    print(f"Exported up to height {response.headers['X-Chain-Height']}: {len(lines)} block(s)")
+    
     # 7. Validate chain
     print_section("9. Validate Blockchain")
     response = requests.get(f"{BASE_URL}/chain/validate")
@@ -102,15 +146,121 @@ def test_api():
     })
     print_response(response)
     
+    print_section("13. Check Balances in One Request")
+    response = requests.post(f"{BASE_URL}/balances", json={
+        "addresses": ["Alice", "Bob", "Charlie", "Miner1"]
+    })
+    print_response(response)
+    
     # 10. Final stats
-    print_section("13. Final Statistics")
+    print_section("14. Final Statistics")
     response = requests.get(f"{BASE_URL}/stats")
     print_response(response)
     
+    # 11. Concurrent submissions while a block is being mined
+    test_submit_while_mining()
+    
+    # 12. Push events
+    test_event_stream()
+    
     print_section("✅ ALL TESTS COMPLETED")
 
+def get_all_blocks():
+    """Fetch the whole chain page by page"""
+    blocks = []
+    cursor = 0
+    while cursor is not None:
+        page = requests.get(f"{BASE_URL}/blocks", params={"from": cursor, "limit": 1000}).json()
+        blocks.extend(page["blocks"])
+        cursor = page["next_cursor"]
+    return blocks
+
+def test_submit_while_mining():
+    """Submit transactions from several threads while a mining job runs"""
+    print_section("15. Submit Transactions While Mining")
+    
+    # Seed the mempool so there is something to mine
+    requests.post(f"{BASE_URL}/transaction", json={
+        "sender": "Seed",
+        "recipient": "Alice",
+        "amount": 1.0
+    })
+    
+    accepted = []
+    lock = threading.Lock()
+    stop = threading.Event()
+    
+    def submit(worker):
+        count = 0
+        while not stop.is_set():
+            count += 1
+            tx = {"sender": f"Worker{worker}", "recipient": "Bob", "amount": float(count)}
+            response = requests.post(f"{BASE_URL}/transaction", json=tx)
+            if response.status_code == 200:
+                with lock:
+                    accepted.append(response.json()["data"]["transaction"])
+    
+    threads = [threading.Thread(target=submit, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    
+    job_id = requests.post(f"{BASE_URL}/mine", json={
+        "miner_address": "Miner1"
+    }).json()["data"]["job_id"]
+    while requests.get(f"{BASE_URL}/mine/{job_id}").json()["data"]["status"] in ("queued", "running"):
+        time.sleep(0.2)
+    
+    stop.set()
+    for thread in threads:
+        thread.join()
+    
+    # Every accepted transaction is either mined exactly once or still pending
+    chain = get_all_blocks()
+    pending = requests.get(f"{BASE_URL}/transactions/pending").json()
+    
+    key = lambda tx: (tx["sender"], tx["recipient"], tx["amount"], tx["timestamp"])
+    mined = [key(tx) for block in chain for tx in block["transactions"]]
+    seen = Counter(mined + [key(tx) for tx in pending])
+    
+    lost = [tx for tx in accepted if seen[key(tx)] != 1]
+    valid = requests.get(f"{BASE_URL}/chain/validate", params={"full": "true"}).json()["success"]
+    
+    print(f"Accepted while mining: {len(accepted)}")
+    print(f"Lost or duplicated: {len(lost)}")
+    print(f"Chain valid: {valid}")
+    assert not lost, "transactions submitted during mining were lost or mined twice"
+    assert valid, "chain is invalid after concurrent mining"
+
+def test_event_stream():
+    """Receive a transaction event over Server-Sent Events"""
+    print_section("16. Subscribe to Events (SSE)")
+    
+    events = []
+    
+    def listen():
+        with requests.get(f"{BASE_URL}/events", params={"address": "Dave"}, stream=True, timeout=10) as response:
+            for line in response.iter_lines(decode_unicode=True):
+                if line.startswith("data:"):
+                    events.append(json.loads(line[5:]))
+                    return
+    
+    listener = threading.Thread(target=listen)
+    listener.start()
+    time.sleep(0.5)
+    
+    requests.post(f"{BASE_URL}/transaction", json={
+        "sender": "Dave",
+        "recipient": "Alice",
+        "amount": 1.0
+    })
+    listener.join(10)
+    
+    print(f"Events received: {json.dumps(events, indent=2)}")
+    assert events and events[0]["type"] == "transaction", "no transaction event received"
+
 if __name__ == "__main__":
     try:
+        wait_until_ready()
         test_api()
     except requests.exceptions.ConnectionError:
         print("\n❌ Error: Cannot connect to API")